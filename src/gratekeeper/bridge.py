@@ -3,11 +3,22 @@ from __future__ import annotations
 import json
 import os
 import socket
+import threading
+from collections import deque
 from dataclasses import dataclass
-from typing import Mapping, Optional
+from typing import Any, Mapping, Optional
+
+try:  # pragma: no cover - optional speedup
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 DEFAULT_SOCKET_PATH = os.getenv("GRATEKEEPER_SOCKET", "/tmp/gratekeeper.sock")
 
+# One persistent connection per socket path; the server reads newline-delimited frames.
+_connections: dict[str, socket.socket] = {}
+_connections_lock = threading.Lock()
+
 
 @dataclass
 class RateLimitUpdate:
@@ -17,6 +28,19 @@ class RateLimitUpdate:
     reset_ts: Optional[int]
 
 
+def _dumps(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def _safe_int(value: object) -> Optional[int]:
     if value is None:
         return None
@@ -56,16 +80,120 @@ def emit_update(
 ) -> bool:
     """Send a single rate-limit update to the local bridge socket.
 
+    The connection is kept open and reused by later calls; if it has gone
+    stale the update is retried once on a fresh connection.
+
     Returns True on success, False otherwise.
     """
     if not socket_path:
         return False
-    payload = json.dumps(update.__dict__) + "\n"
-    try:
-        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+    return _send_frame(_dumps(update.__dict__) + b"\n", socket_path, timeout)
+
+
+def _send_frame(payload: bytes, socket_path: str, timeout: float) -> bool:
+    with _connections_lock:
+        sock = _connections.get(socket_path)
+        if sock is not None:
+            try:
+                sock.settimeout(timeout)
+                sock.sendall(payload)
+                return True
+            except OSError:
+                # Stale connection (e.g. dashboard restarted); reconnect once.
+                _drop_connection(socket_path)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
             sock.settimeout(timeout)
             sock.connect(socket_path)
-            sock.sendall(payload.encode("utf-8"))
+            sock.sendall(payload)
+        except OSError:
+            sock.close()
+            return False
+        _connections[socket_path] = sock
         return True
-    except OSError:
-        return False
+
+
+class BatchingEmitter:
+    """Coalesce bursts of updates into JSON-array frames on the bridge socket.
+
+    Updates are queued by ``submit`` and flushed by a background thread every
+    ``interval`` seconds, or as soon as ``max_batch`` updates are pending.
+    """
+
+    def __init__(
+        self,
+        *,
+        socket_path: Optional[str] = DEFAULT_SOCKET_PATH,
+        interval: float = 0.01,
+        max_batch: int = 10,
+        timeout: float = 1.0,
+    ) -> None:
+        self._socket_path = socket_path
+        self._interval = max(interval, 0.001)
+        self._max_batch = max(max_batch, 1)
+        self._timeout = timeout
+        self._pending: deque[RateLimitUpdate] = deque()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, update: RateLimitUpdate) -> None:
+        """Queue an update for the next flush."""
+        if not self._socket_path:
+            return
+        self._pending.append(update)
+        if len(self._pending) >= self._max_batch:
+            self._wake.set()
+        self._ensure_thread()
+
+    def flush(self) -> bool:
+        """Send everything queued so far as one frame. Returns False on failure."""
+        batch: list[dict[str, Any]] = []
+        while self._pending:
+            batch.append(self._pending.popleft().__dict__)
+        if not batch or not self._socket_path:
+            return True
+        return _send_frame(_dumps(batch) + b"\n", self._socket_path, self._timeout)
+
+    def close(self) -> None:
+        """Stop the flush thread and send any remaining updates."""
+        self._stop.set()
+        self._wake.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=1.0)
+            self._thread = None
+        self.flush()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None and not self._stop.is_set():
+                self._thread = threading.Thread(
+                    target=self._run, name="GratekeeperBridgeFlush", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(timeout=self._interval)
+            self._wake.clear()
+            self.flush()
+
+
+def close_connections() -> None:
+    """Close every cached bridge connection."""
+    with _connections_lock:
+        for path in list(_connections):
+            _drop_connection(path)
+
+
+def _drop_connection(socket_path: str) -> None:
+    sock = _connections.pop(socket_path, None)
+    if sock is not None:
+        try:
+            sock.close()
+        except OSError:
+            pass
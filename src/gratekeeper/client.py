@@ -11,7 +11,13 @@ import requests  # type: ignore[import-untyped]
 from dotenv import load_dotenv
 
 from .logging_utils import ensure_rich_logging, format_status, style_text
-from .ratekeeper import BucketState, LocalGratekeeper
+from .ratekeeper import (
+    HEADER_LIMIT,
+    HEADER_REMAINING,
+    HEADER_RESET,
+    BucketState,
+    LocalGratekeeper,
+)
 
 logger = logging.getLogger("gratekeeper")
 ensure_rich_logging()
@@ -19,6 +25,7 @@ ensure_rich_logging()
 DEFAULT_BASE_URL = "https://api.github.com/"
 DEFAULT_ACCEPT = "application/vnd.github+json"
 DEFAULT_USER_AGENT = "gratekeeper/1.0.0"
+POLL_BACKOFF_USAGE = 0.8  # adaptive polling backs off above this bucket usage
 _DOTENV_LOADED = False
 
 
@@ -58,11 +65,15 @@ class RateLimitedGitHubClient:
         self._poll_stop_event = threading.Event()
         self._poll_reset_event = threading.Event()
         self._poll_interval = 60.0
+        self._poll_min_interval = 60.0
+        self._poll_max_interval = 60.0
+        self._poll_adaptive = False
         self._poll_bucket = "core"
         self._rate_listeners: list[Callable[[str, BucketState], None]] = []
         self._listener_lock = threading.Lock()
         self._killswitch_until: Optional[float] = killswitch_until
         self._killswitch_reason: Optional[str] = None
+        self._etag_cache: dict[tuple[str, tuple], tuple[str, Any]] = {}
 
     @staticmethod
     def _normalize_base_url(base_url: str) -> str:
@@ -209,9 +220,22 @@ class RateLimitedGitHubClient:
         timeout: Optional[float] = None,
         bucket: str = "core",
         raise_for_status: bool = True,
+        conditional: bool = False,
         **request_kwargs: Any,
     ):
-        """Convenience helper that returns parsed JSON content."""
+        """Convenience helper that returns parsed JSON content.
+
+        With ``conditional=True`` the last ETag for this path/params is sent as
+        ``If-None-Match``; a 304 reply returns the previously parsed payload and
+        does not count against GitHub's rate limit.
+        """
+        cache_key: Optional[tuple[str, tuple]] = None
+        cached = None
+        if conditional:
+            cache_key = (self._resolve_url(path), _params_cache_key(params))
+            cached = self._etag_cache.get(cache_key)
+        if cached is not None:
+            headers = {**(headers or {}), "If-None-Match": cached[0]}
         response = self.get(
             path,
             params=params,
@@ -221,7 +245,14 @@ class RateLimitedGitHubClient:
             raise_for_status=raise_for_status,
             **request_kwargs,
         )
-        return response.json()
+        if cached is not None and response.status_code == 304:
+            return cached[1]
+        payload = response.json()
+        if cache_key is not None:
+            etag = response.headers.get("ETag")
+            if etag and response.status_code == 200:
+                self._etag_cache[cache_key] = (etag, payload)
+        return payload
 
     def graphql_json(
         self,
@@ -295,9 +326,9 @@ class RateLimitedGitHubClient:
             if updated:
                 self._reset_poll_timer()
                 self._notify_rate_limit_listeners(bucket)
-        remaining = response.headers.get("X-RateLimit-Remaining")
-        limit = response.headers.get("X-RateLimit-Limit")
-        reset = response.headers.get("X-RateLimit-Reset")
+        remaining = response.headers.get(HEADER_REMAINING)
+        limit = response.headers.get(HEADER_LIMIT)
+        reset = response.headers.get(HEADER_RESET)
         is_rate_limit_error = response.status_code == 429 or (
             response.status_code == 403 and remaining == "0"
         )
@@ -356,10 +387,29 @@ class RateLimitedGitHubClient:
     # Polling support
 
     def start_rate_limit_polling(
-        self, *, interval_seconds: float = 60.0, bucket: str = "core"
+        self,
+        *,
+        interval_seconds: float = 60.0,
+        bucket: str = "core",
+        adaptive: bool = False,
+        min_interval_seconds: Optional[float] = None,
+        max_interval_seconds: Optional[float] = None,
     ) -> None:
-        """Start polling GET /rate_limit to refresh headers in the background."""
+        """Start polling GET /rate_limit to refresh headers in the background.
+
+        With ``adaptive=True`` the interval follows an AIMD rule: it shrinks by
+        ``min_interval_seconds`` after each healthy poll and doubles (up to
+        ``max_interval_seconds``) on 429s or when bucket usage exceeds
+        ``POLL_BACKOFF_USAGE``. Bounds default to 1/4 and 4x the interval.
+        """
         self._poll_interval = max(0.01, interval_seconds)
+        self._poll_adaptive = adaptive
+        self._poll_min_interval = max(
+            0.01, min_interval_seconds or self._poll_interval / 4
+        )
+        self._poll_max_interval = max(
+            self._poll_min_interval, max_interval_seconds or self._poll_interval * 4
+        )
         self._poll_bucket = bucket
 
         if self._poll_thread and self._poll_thread.is_alive():
@@ -396,10 +446,37 @@ class RateLimitedGitHubClient:
                 continue
 
             try:
-                self.get_json("/rate_limit", bucket=self._poll_bucket)
+                response = self.get(
+                    "/rate_limit", bucket=self._poll_bucket, raise_for_status=False
+                )
+                if self._poll_adaptive:
+                    self._adapt_poll_interval(response.status_code)
+                response.raise_for_status()
             except Exception as exc:  # pragma: no cover - best-effort logging
                 logger.warning("Rate limit poll failed: %s", exc)
 
+    def _adapt_poll_interval(self, status_code: int) -> None:
+        state = self.rate_limit_snapshot(self._poll_bucket)
+        backoff = status_code == 429 or (status_code == 403 and state.remaining == 0)
+        if not backoff and state.limit and state.remaining is not None:
+            backoff = 1 - state.remaining / state.limit > POLL_BACKOFF_USAGE
+        if backoff:
+            self._poll_interval = min(self._poll_interval * 2, self._poll_max_interval)
+        else:
+            self._poll_interval = max(
+                self._poll_interval - self._poll_min_interval, self._poll_min_interval
+            )
+
     def _reset_poll_timer(self) -> None:
         if self._poll_thread and self._poll_thread.is_alive():
             self._poll_reset_event.set()
+
+
+def _params_cache_key(params: Any) -> tuple:
+    """Hashable, order-independent key for any params shape requests accepts."""
+    if not params:
+        return ()
+    if isinstance(params, (str, bytes)):
+        return (params,)
+    items = params.items() if isinstance(params, Mapping) else params
+    return tuple(sorted((str(key), repr(value)) for key, value in items))
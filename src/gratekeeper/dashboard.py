@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
 import os
 import select
@@ -10,6 +11,8 @@ import subprocess
 import sys
 import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Iterable, Mapping, MutableMapping, Optional
@@ -26,6 +29,9 @@ from .bridge import DEFAULT_SOCKET_PATH
 
 logger = logging.getLogger("gratekeeper.dashboard")
 
+ACTIONS_MAX_WORKERS = 8  # per-host cap for concurrent Actions REST calls
+RESOURCE_POOL_MAX = 256  # buckets whose latest RateLimitResource is reused
+
 try:  # pragma: no cover - platform dependent
     import termios
     import tty
@@ -34,13 +40,39 @@ except ImportError:  # pragma: no cover
     tty = None  # type: ignore[assignment]
 
 
-@dataclass
+# Latest resource per bucket, shared by snapshot, bridge and fetch parsing.
+_RESOURCE_POOL: dict[str, RateLimitResource] = {}
+
+
+@dataclass(frozen=True, slots=True)
 class RateLimitResource:
     bucket: str
     limit: Optional[int]
     remaining: Optional[int]
     reset_ts: Optional[int]
 
+    @classmethod
+    def from_update(
+        cls,
+        bucket: str,
+        limit: Optional[int],
+        remaining: Optional[int],
+        reset_ts: Optional[int],
+    ) -> RateLimitResource:
+        """Return the pooled instance for ``bucket`` when its values are unchanged."""
+        cached = _RESOURCE_POOL.get(bucket)
+        if (
+            cached is not None
+            and cached.remaining == remaining
+            and cached.limit == limit
+            and cached.reset_ts == reset_ts
+        ):
+            return cached
+        resource = cls(bucket, limit, remaining, reset_ts)
+        if cached is not None or len(_RESOURCE_POOL) < RESOURCE_POOL_MAX:
+            _RESOURCE_POOL[bucket] = resource
+        return resource
+
     @property
     def used(self) -> Optional[int]:
         if self.limit is None or self.remaining is None:
@@ -114,10 +146,14 @@ class RateLimitDashboard:
         self._actions_status: MutableMapping[str, ActionsRepoStatus] = {}
         self._actions_billing: MutableMapping[str, ActionsBillingStatus] = {}
         self._last_actions_fetch_ts: Optional[float] = None
+        # Created by run() and shut down when it exits.
+        self._actions_pool: Optional[ThreadPoolExecutor] = None
         self._manual_fetch_event = threading.Event()
         self._wakeup_event = threading.Event()
         self._input_stop_event = threading.Event()
         self._input_thread: Optional[threading.Thread] = None
+        # Write end of the self-pipe used to wake the input thread on shutdown.
+        self._input_wake_fd: Optional[int] = None
         self._min_refresh_interval = 0.5
         self._max_refresh_interval = 300.0
 
@@ -127,6 +163,7 @@ class RateLimitDashboard:
         self._client.add_rate_limit_listener(listener)
         self._start_input_listener()
         try:
+            self._actions_pool = _new_actions_pool()
             with Live(
                 self._render_panel(),
                 refresh_per_second=self._refresh_rate_value(),
@@ -150,6 +187,9 @@ class RateLimitDashboard:
         finally:
             self._client.remove_rate_limit_listener(listener)
             self._stop_input_listener()
+            pool, self._actions_pool = self._actions_pool, None
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
 
     def _handle_snapshot(self, bucket: str, state: BucketState) -> None:
         resource = _resource_from_snapshot(bucket, state)
@@ -313,35 +353,55 @@ class RateLimitDashboard:
                 with self._lock:
                     self._last_fetch_error = str(exc)
 
-        self._maybe_fetch_actions(force=force)
+        self._maybe_fetch_actions(force=force, now=now)
 
-    def _maybe_fetch_actions(self, *, force: bool = False) -> None:
+    def _maybe_fetch_actions(
+        self, *, force: bool = False, now: Optional[float] = None
+    ) -> None:
         if (
             not self._actions_repos
             and not self._actions_billing_user
             and not self._actions_billing_org
         ):
             return
-        now = time.time()
+        if now is None:
+            now = time.time()
         with self._lock:
             last_fetch = self._last_actions_fetch_ts
         if not force and last_fetch and now - last_fetch < self._fetch_interval:
             return
-        statuses: MutableMapping[str, ActionsRepoStatus] = {}
-        if self._actions_repos:
-            for repo in self._actions_repos:
-                status = self._fetch_actions_repo(repo)
-                if status:
-                    statuses[repo] = status
-        billing: MutableMapping[str, ActionsBillingStatus] = {}
+        # Each call is a blocking HTTP round trip, so dispatch them all at once.
+        pool = self._actions_pool
+        if pool is None:
+            # Called outside run(): use a short-lived pool for this fetch.
+            with _new_actions_pool() as pool:
+                self._fetch_actions_with(pool, now)
+            return
+        self._fetch_actions_with(pool, now)
+
+    def _fetch_actions_with(self, pool: ThreadPoolExecutor, now: float) -> None:
+        repo_futures = [
+            (repo, pool.submit(self._fetch_actions_repo, repo))
+            for repo in self._actions_repos
+        ]
+        billing_scopes: list[tuple[str, Optional[str]]] = []
         if self._actions_billing_user:
-            billing_status = self._fetch_actions_billing(scope=("user", None))
-            if billing_status:
-                billing[billing_status.scope] = billing_status
+            billing_scopes.append(("user", None))
         if self._actions_billing_org:
-            billing_status = self._fetch_actions_billing(
-                scope=("org", self._actions_billing_org)
-            )
+            billing_scopes.append(("org", self._actions_billing_org))
+        billing_futures = [
+            pool.submit(self._fetch_actions_billing, scope=scope)
+            for scope in billing_scopes
+        ]
+
+        statuses: MutableMapping[str, ActionsRepoStatus] = {}
+        for repo, future in repo_futures:
+            status = future.result()
+            if status:
+                statuses[repo] = status
+        billing: MutableMapping[str, ActionsBillingStatus] = {}
+        for future in billing_futures:
+            billing_status = future.result()
             if billing_status:
                 billing[billing_status.scope] = billing_status
 
@@ -355,37 +415,26 @@ class RateLimitDashboard:
         try:
             payload = self._client.get_json(
                 path,
-                params={"per_page": "20"},
+                # Drop the embedded pull_requests arrays; only run status is read.
+                params={"per_page": "20", "exclude_pull_requests": "true"},
                 raise_for_status=False,
+                conditional=True,
             )
         except Exception:
             return None
         runs = payload.get("workflow_runs") if isinstance(payload, Mapping) else None
         if not isinstance(runs, list):
             return None
-        in_progress = 0
-        queued = 0
-        latest_status: Optional[str] = None
-        latest_conclusion: Optional[str] = None
-        latest_updated: Optional[str] = None
-        for run in runs:
-            status = run.get("status")
-            conclusion = run.get("conclusion")
-            if status == "in_progress":
-                in_progress += 1
-            elif status == "queued":
-                queued += 1
-            if latest_status is None:
-                latest_status = status
-                latest_conclusion = conclusion
-                latest_updated = run.get("updated_at")
+        counts = Counter(run.get("status") for run in runs)
+        # GitHub returns runs newest-first.
+        latest = runs[0] if runs else {}
         return ActionsRepoStatus(
             repo=repo,
-            in_progress=in_progress,
-            queued=queued,
-            latest_status=latest_status,
-            latest_conclusion=latest_conclusion,
-            latest_updated=latest_updated,
+            in_progress=counts["in_progress"],
+            queued=counts["queued"],
+            latest_status=latest.get("status"),
+            latest_conclusion=latest.get("conclusion"),
+            latest_updated=latest.get("updated_at"),
         )
 
     def _fetch_actions_billing(
@@ -401,7 +450,9 @@ class RateLimitDashboard:
         else:
             return None
         try:
-            payload = self._client.get_json(path, raise_for_status=False)
+            payload = self._client.get_json(
+                path, raise_for_status=False, conditional=True
+            )
         except Exception:
             return None
         if not isinstance(payload, Mapping):
@@ -426,8 +477,12 @@ class RateLimitDashboard:
         if self._input_thread and self._input_thread.is_alive():
             return
         self._input_stop_event.clear()
+        wake_read_fd, self._input_wake_fd = os.pipe()
         self._input_thread = threading.Thread(
-            target=self._input_loop, name="GratekeeperInput", daemon=True
+            target=self._input_loop,
+            args=(wake_read_fd,),
+            name="GratekeeperInput",
+            daemon=True,
         )
         self._input_thread.start()
 
@@ -435,17 +490,35 @@ class RateLimitDashboard:
         if not self._input_thread:
             return
         self._input_stop_event.set()
+        wake_fd = self._input_wake_fd
+        self._input_wake_fd = None
+        if wake_fd is not None:
+            # The input thread owns and closes the read end; we own the write end.
+            try:
+                os.write(wake_fd, b"\0")
+            except OSError:
+                pass
+            os.close(wake_fd)
         self._input_thread.join(timeout=0.2)
         self._input_thread = None
 
-    def _input_loop(self) -> None:  # pragma: no cover - requires interactive TTY
+    def _input_loop(self, wake_fd: int) -> None:  # pragma: no cover - requires TTY
+        try:
+            self._read_keys(wake_fd)
+        finally:
+            os.close(wake_fd)
+
+    def _read_keys(self, wake_fd: int) -> None:  # pragma: no cover - requires TTY
         assert termios is not None and tty is not None
         fd = sys.stdin.fileno()
         old_settings = termios.tcgetattr(fd)
         try:
             tty.setcbreak(fd)
             while not self._input_stop_event.is_set():
-                readable, _, _ = select.select([fd], [], [], 0.1)
+                # Block until a key arrives or shutdown writes to the wake pipe.
+                readable, _, _ = select.select([fd, wake_fd], [], [])
+                if wake_fd in readable:
+                    break
                 if fd in readable:
                     key = sys.stdin.read(1)
                     if key:
@@ -536,32 +609,40 @@ def _fmt_reset_time(reset_ts: Optional[int]) -> str:
     return dt.strftime("%H:%M:%S")
 
 
+def _new_actions_pool() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=ACTIONS_MAX_WORKERS, thread_name_prefix="gk-actions"
+    )
+
+
 def _resource_from_snapshot(bucket: str, state: BucketState) -> RateLimitResource:
-    return RateLimitResource(
-        bucket=bucket,
-        limit=state.limit,
-        remaining=state.remaining,
-        reset_ts=state.reset_ts,
+    return RateLimitResource.from_update(
+        bucket, state.limit, state.remaining, state.reset_ts
     )
 
 
 def _coerce_resources(
     resources: Mapping[str, Mapping[str, object]],
 ) -> MutableMapping[str, RateLimitResource]:
-    parsed: MutableMapping[str, RateLimitResource] = {}
-    for bucket, data in resources.items():
-        limit = _safe_int(data.get("limit"))
-        remaining = _safe_int(data.get("remaining"))
-        reset = _safe_int(data.get("reset"))
-        parsed[bucket] = RateLimitResource(
-            bucket=bucket, limit=limit, remaining=remaining, reset_ts=reset
+    coerce = _safe_int  # local binding avoids a global lookup per field
+    make = RateLimitResource.from_update
+    return {
+        bucket: make(
+            bucket,
+            coerce(data.get("limit")),
+            coerce(data.get("remaining")),
+            coerce(data.get("reset")),
         )
-    return parsed
+        for bucket, data in resources.items()
+    }
 
 
 def _safe_int(value: object) -> Optional[int]:
     if value is None:
         return None
+    if type(value) is int:
+        # Common case: already a plain int, skip the tuple isinstance and int().
+        return value
     if isinstance(value, (int, float)):
         return int(value)
     if isinstance(value, str):
@@ -575,8 +656,14 @@ def _safe_int(value: object) -> Optional[int]:
     return None
 
 
+@functools.lru_cache(maxsize=4)
+def _which_cached(name: str) -> Optional[str]:
+    # PATH rarely changes while the app runs; call cache_clear() if it does.
+    return shutil.which(name)
+
+
 def _launch_in_tmux(argv: list[str]) -> bool:
-    if shutil.which("tmux") is None:
+    if _which_cached("tmux") is None:
         return False
     if not os.environ.get("TMUX"):
         return False
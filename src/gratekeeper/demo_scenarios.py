@@ -5,7 +5,7 @@ import os
 import subprocess
 import sys
 import time
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Callable, Optional
 from pathlib import Path
 
@@ -161,7 +161,7 @@ def scenario_graphql(ctx: RunContext) -> ScenarioResult:
         payload = client.graphql_json(query, variables={"login": "octocat"})
         snapshot = client.rate_limit_snapshot("graphql")
         details = json.dumps(
-            {"data": payload.get("data"), "bucket": snapshot.__dict__},
+            {"data": payload.get("data"), "bucket": asdict(snapshot)},
             indent=2,
         )
         success = True
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import logging
+import sys
 from dataclasses import dataclass, replace
 from datetime import datetime, timezone
+from functools import lru_cache
 from threading import Lock
 from typing import Callable, Dict, Mapping, Optional
 import time
@@ -16,8 +18,28 @@ SleepFn = Callable[[float], None]
 logger = logging.getLogger("gratekeeper")
 ensure_rich_logging()
 
+HEADER_LIMIT = sys.intern("X-RateLimit-Limit")
+HEADER_REMAINING = sys.intern("X-RateLimit-Remaining")
+HEADER_RESET = sys.intern("X-RateLimit-Reset")
 
-@dataclass
+# Limit and reset repeat across every response in a window; remaining does not.
+_parse_repeating_int = lru_cache(maxsize=64)(int)
+
+
+def _compute_sleep_seconds(
+    remaining: int,
+    soft_floor: int,
+    reset_ts: Optional[int],
+    now: int,
+    safety_buffer_seconds: int,
+) -> int:
+    """Seconds to wait before the next request; zero while above the soft floor."""
+    if reset_ts is None:
+        return 0
+    return max(reset_ts - now + safety_buffer_seconds, 0) * (remaining <= soft_floor)
+
+
+@dataclass(slots=True)
 class BucketState:
     """Observed GitHub rate-limit state for a single logical bucket."""
 
@@ -29,6 +51,16 @@ class BucketState:
 class LocalGratekeeper:
     """Tracks GitHub rate-limit headers locally and sleeps before exhaustion."""
 
+    __slots__ = (
+        "_buckets",
+        "soft_floor_fraction",
+        "soft_floor_min",
+        "safety_buffer_seconds",
+        "_now_fn",
+        "_sleep_fn",
+        "_lock",
+    )
+
     def __init__(
         self,
         *,
@@ -59,7 +91,9 @@ class LocalGratekeeper:
         sleep_context: Optional[tuple[str, Optional[int], int, Optional[int]]] = None
 
         with self._lock:
-            state = self._buckets.setdefault(bucket, BucketState())
+            state = self._buckets.get(bucket)
+            if state is None:
+                state = self._buckets[bucket] = BucketState()
             now = self._now()
 
             if state.reset_ts is not None and now >= state.reset_ts:
@@ -74,17 +108,18 @@ class LocalGratekeeper:
                 int(state.limit * self.soft_floor_fraction), self.soft_floor_min
             )
 
-            if (
-                state.remaining <= soft_floor
-                and state.reset_ts is not None
-                and now < state.reset_ts
-            ):
-                sleep_for = max(state.reset_ts - now + self.safety_buffer_seconds, 0)
-                sleep_context = (bucket, state.remaining, soft_floor, state.reset_ts)
+            # An expired window was cleared above, so a known reset is in the future.
+            reset_ts = state.reset_ts
+            sleep_for = _compute_sleep_seconds(
+                state.remaining, soft_floor, reset_ts, now, self.safety_buffer_seconds
+            )
+
+            if sleep_for > 0:
+                sleep_context = (bucket, state.remaining, soft_floor, reset_ts)
             elif state.remaining > 0:
                 state.remaining -= 1
 
-        if sleep_for and sleep_for > 0:
+        if sleep_for:
             bucket_name, remaining, floor, reset_ts = sleep_context or (
                 bucket,
                 None,
@@ -103,13 +138,24 @@ class LocalGratekeeper:
 
         Returns True if any value was updated.
         """
-        limit = self._parse_int_header(headers.get("X-RateLimit-Limit"))
-        remaining = self._parse_int_header(headers.get("X-RateLimit-Remaining"))
-        reset = self._parse_int_header(headers.get("X-RateLimit-Reset"))
+        _int = int
+        _repeating = _parse_repeating_int
+        try:
+            # Fast path: GitHub sends all three headers as plain integers.
+            limit = _repeating(headers[HEADER_LIMIT])
+            remaining = _int(headers[HEADER_REMAINING])
+            reset = _repeating(headers[HEADER_RESET])
+        except (KeyError, TypeError, ValueError):
+            parse = self._parse_int_header
+            limit = parse(headers.get(HEADER_LIMIT))
+            remaining = parse(headers.get(HEADER_REMAINING))
+            reset = parse(headers.get(HEADER_RESET))
 
         updated = False
         with self._lock:
-            state = self._buckets.setdefault(bucket, BucketState())
+            state = self._buckets.get(bucket)
+            if state is None:
+                state = self._buckets[bucket] = BucketState()
 
             if limit is not None:
                 state.limit = limit
@@ -146,5 +192,7 @@ class LocalGratekeeper:
     def snapshot(self, bucket: str = "core") -> BucketState:
         """Return a shallow copy of the current bucket state for inspection."""
         with self._lock:
-            state = self._buckets.setdefault(bucket, BucketState())
+            state = self._buckets.get(bucket)
+            if state is None:
+                state = self._buckets[bucket] = BucketState()
             return replace(state)
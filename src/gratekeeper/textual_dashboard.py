@@ -1,14 +1,29 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
 import os
+import string
+import threading
 import time
+from bisect import bisect_right
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable, Iterable, Mapping, MutableMapping, Optional
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Optional,
+    TypeVar,
+)
 
 from rich.console import Group
 from rich.panel import Panel
@@ -31,7 +46,7 @@ from .dashboard import (
     _fmt_int,
     _resource_from_snapshot,
 )
-from .bridge import DEFAULT_SOCKET_PATH, RateLimitUpdate
+from .bridge import DEFAULT_SOCKET_PATH, RateLimitUpdate, _loads
 from .ratekeeper import BucketState
 
 
@@ -46,6 +61,8 @@ class _RateLimitSocketServer:
         self._path = path
         self._handler = handler
         self._server: asyncio.AbstractServer | None = None
+        # Open client connections; emitters keep theirs alive between updates.
+        self._writers: set[asyncio.StreamWriter] = set()
 
     async def start(self) -> None:
         if not self._path:
@@ -67,31 +84,58 @@ class _RateLimitSocketServer:
         if self._server is None:
             return
         self._server.close()
-        await self._server.wait_closed()
+        # Python 3.12.1+ waits for every client in wait_closed(), and emitters
+        # hold their connection open, so close them first.
+        for writer in list(self._writers):
+            writer.close()
+        try:
+            await asyncio.wait_for(
+                self._server.wait_closed(), timeout=BRIDGE_STOP_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:  # pragma: no cover - defensive
+            logger.debug("Socket bridge did not close within timeout")
+        self._server = None
 
     async def _handle_client(
         self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
     ) -> None:
+        self._writers.add(writer)
         try:
             while not reader.at_eof():
                 line = await reader.readline()
                 if not line:
                     break
                 try:
-                    payload = json.loads(line.decode("utf-8"))
-                    bucket = payload.get("bucket")
-                    if not bucket:
-                        continue
-                    update = RateLimitUpdate(
-                        bucket=str(bucket),
-                        limit=_coerce_int(payload.get("limit")),
-                        remaining=_coerce_int(payload.get("remaining")),
-                        reset_ts=_coerce_int(payload.get("reset_ts")),
-                    )
-                    self._handler(update)
+                    payload = _loads(line)
                 except Exception:
                     continue
+                # Frames carry either one update or a batch (JSON array).
+                items = payload if isinstance(payload, list) else [payload]
+                if len(items) > 1:
+                    # Within a batch only the newest update per bucket matters.
+                    latest: dict[str, Any] = {}
+                    for item in items:
+                        if isinstance(item, dict):
+                            latest[str(item.get("bucket"))] = item
+                    items = list(latest.values())
+                for item in items:
+                    try:
+                        bucket = item.get("bucket")
+                        if not bucket:
+                            continue
+                        update = RateLimitUpdate(
+                            bucket=str(bucket),
+                            limit=_coerce_int(item.get("limit")),
+                            remaining=_coerce_int(item.get("remaining")),
+                            reset_ts=_coerce_int(item.get("reset_ts")),
+                        )
+                        self._handler(update)
+                    except Exception:
+                        continue
+        except (ConnectionError, OSError):
+            pass
         finally:
+            self._writers.discard(writer)
             writer.close()
             try:
                 await writer.wait_closed()
@@ -101,8 +145,17 @@ class _RateLimitSocketServer:
 
 logger = logging.getLogger("gratekeeper.textual-dashboard")
 
+_T = TypeVar("_T")
+
 CONFIG_PATH = Path.home() / ".gratekeeper_ui.json"
 ACTIVITY_WINDOW_SECONDS = 300.0  # five minutes
+MAX_TRACKED_BUCKETS = 256  # caps per-bucket state if unexpected names appear
+NOW_CACHE_TTL_SECONDS = 0.5  # cards rendered in the same pulse share one "now"
+REST_MAX_WORKERS = 16  # dedicated pool for GitHub REST calls
+BRIDGE_STOP_TIMEOUT_SECONDS = 1.0  # cap on waiting for bridge clients at shutdown
+LIVE_FRESHNESS_FRACTION = 0.8  # a bucket is live-fresh within this * fetch interval
+LIVE_GAP_EWMA_ALPHA = 0.3  # weight of the newest gap between live updates
+POLL_MAX_BACKOFF = 4.0  # max poll spacing, in fetch intervals, while live data flows
 IGNORED_BUCKETS = {
     # Rare/long-tail buckets; still viewable via --buckets override.
     "integration_manifest",
@@ -153,9 +206,17 @@ class BucketCard(Static):
     def __init__(self, bucket: str) -> None:
         super().__init__(id=f"bucket-{bucket}")
         self.bucket = bucket
+        self._used_str = "0"
+        self._limit_str = "0"
+        self._remaining_str = _fmt_int(None)
 
     def set_resource(self, resource: Optional[RateLimitResource]) -> None:
         self.resource = resource
+        if resource:
+            # Counts only change with the resource; countdowns are formatted per render.
+            self._used_str = f"{resource.used or 0:,}"
+            self._limit_str = f"{resource.limit or 0:,}"
+            self._remaining_str = _fmt_int(resource.remaining)
         self.refresh()
 
     def render(self) -> Panel:
@@ -166,26 +227,23 @@ class BucketCard(Static):
             return Panel(body, title=self.bucket, border_style="cyan")
 
         pct = resource.usage_percent or 0.0
-        used = resource.used or 0
-        limit = resource.limit or 0
-        remaining = resource.remaining
         tone = _bucket_tone(resource)
 
         bar = _usage_bar(pct, tone)
         reset_at = _fmt_reset_time(resource.reset_ts)
-        resets_in = _fmt_delta(resource.reset_ts, datetime.now(timezone.utc))
+        resets_in = _fmt_delta(resource.reset_ts, _shared_now_utc())
 
         body = Group(
             Text.from_markup(bar),
             Text.assemble(
                 (" used ", "dim"),
-                (f"{used:,}", tone),
+                (self._used_str, tone),
                 (" of ", "dim"),
-                (f"{limit:,}", "bold"),
+                (self._limit_str, "bold"),
             ),
             Text.assemble(
                 ("remaining ", "dim"),
-                (_fmt_int(remaining), "bold"),
+                (self._remaining_str, "bold"),
                 "  ",
                 (resets_in, "italic"),
             ),
@@ -205,11 +263,13 @@ class BucketLegend(Static):
     def __init__(self) -> None:
         super().__init__(id="bucket-legend")
         self._buckets: tuple[str, ...] = tuple()
-        self._visible: MutableMapping[str, bool] = {}
-        self._tones: MutableMapping[str, str] = {}
-        self._recent: MutableMapping[str, bool] = {}
+        self._visible: Mapping[str, bool] = {}
+        self._tones: Mapping[str, str] = {}
+        self._recent: Mapping[str, bool] = {}
         self._preset: str = "all"
         self._note: Optional[str] = None
+        self._render_key: Optional[tuple] = None
+        self._render_panel: Optional[Panel] = None
 
     def update_state(
         self,
@@ -221,15 +281,38 @@ class BucketLegend(Static):
         preset: str,
         note: Optional[str],
     ) -> None:
+        """Replace the legend state.
+
+        The mappings are kept by reference; callers hand over freshly built
+        dicts and must not mutate them afterwards.
+        """
+        # Bucket order is fixed, so positional tuples hash cheaper than frozensets.
+        key = (
+            buckets,
+            tuple(visible.get(bucket, True) for bucket in buckets),
+            tuple(tones.get(bucket, "cyan") for bucket in buckets),
+            tuple(recent.get(bucket, False) for bucket in buckets),
+            preset,
+            note,
+        )
+        if key == self._render_key:
+            return
         self._buckets = buckets
-        self._visible = dict(visible)
-        self._tones = dict(tones)
-        self._recent = dict(recent)
+        self._visible = visible
+        self._tones = tones
+        self._recent = recent
         self._preset = preset
         self._note = note
+        self._render_key = key
+        self._render_panel = None
         self.refresh()
 
     def render(self) -> Panel:
+        if self._render_panel is None:
+            self._render_panel = self._build_panel()
+        return self._render_panel
+
+    def _build_panel(self) -> Panel:
         text = Text()
         for idx, bucket in enumerate(self._buckets, start=1):
             label = str(idx if idx < 10 else 0)
@@ -258,13 +341,15 @@ class BucketLegend(Static):
 
 
 class ActionsPanel(Static):
-    statuses: MutableMapping[str, ActionsRepoStatus]
-    billing: MutableMapping[str, ActionsBillingStatus]
+    statuses: Mapping[str, ActionsRepoStatus]
+    billing: Mapping[str, ActionsBillingStatus]
 
     def __init__(self) -> None:
         super().__init__(id="actions")
         self.statuses = {}
         self.billing = {}
+        self._cached_sig: Optional[tuple] = None
+        self._cached_panel: Optional[Panel] = None
 
     def update_data(
         self,
@@ -272,11 +357,37 @@ class ActionsPanel(Static):
         statuses: Mapping[str, ActionsRepoStatus],
         billing: Mapping[str, ActionsBillingStatus],
     ) -> None:
-        self.statuses = dict(statuses)
-        self.billing = dict(billing)
+        """Replace the panel data; mappings are kept by reference, not copied."""
+        sig = (
+            tuple(
+                (
+                    repo,
+                    status.in_progress,
+                    status.queued,
+                    status.latest_status,
+                    status.latest_conclusion,
+                )
+                for repo, status in sorted(statuses.items())
+            ),
+            tuple(
+                (scope, data.total_minutes_used, data.included_minutes)
+                for scope, data in sorted(billing.items())
+            ),
+        )
+        self.statuses = statuses
+        self.billing = billing
+        if sig == self._cached_sig:
+            return
+        self._cached_sig = sig
+        self._cached_panel = None
         self.refresh()
 
     def render(self) -> Panel:
+        if self._cached_panel is None:
+            self._cached_panel = self._build_panel()
+        return self._cached_panel
+
+    def _build_panel(self) -> Panel:
         statuses = self.statuses
         billing = self.billing
         if not statuses and not billing:
@@ -362,44 +473,86 @@ class RateLimitTextualApp(App):
         self._socket_path = socket_path
         self._bridge_server: _RateLimitSocketServer | None = None
 
-        self._resources: MutableMapping[str, RateLimitResource] = {}
+        self._resources: OrderedDict[str, RateLimitResource] = OrderedDict()
+        self._last_resources_sig: Optional[tuple] = None
         self._actions_status: MutableMapping[str, ActionsRepoStatus] = {}
         self._actions_billing: MutableMapping[str, ActionsBillingStatus] = {}
         self._meta = DashboardMeta()
         self._bucket_cards: MutableMapping[str, BucketCard] = {}
         self._manual_visibility: MutableMapping[str, bool] = {}
-        self._last_remaining: MutableMapping[str, Optional[int]] = {}
-        self._last_change_ts: MutableMapping[str, float] = {}
+        self._bucket_order_cache: tuple[frozenset[str], tuple[str, ...]] | None = None
+        self._indexed_order: tuple[str, ...] = tuple()
+        self._bucket_index: dict[str, int] = {}
+        self._visible_mask: list[bool] = []
+        self._last_remaining: OrderedDict[str, Optional[int]] = OrderedDict()
+        self._recent_buckets: set[str] = set()
+        # Bit i is set when bucket i of _indexed_order is in _recent_buckets.
+        self._active_bits = 0
+        # Monotonic time of each active bucket's latest change.
+        self._recent_seen: dict[str, float] = {}
+        self._activity_timer: Timer | None = None
+        # Latest listener snapshot per bucket, drained once per loop turn.
+        self._pending_snapshots: dict[str, RateLimitResource] = {}
+        self._pending_lock = threading.Lock()
+        self._event_loop: asyncio.AbstractEventLoop | None = None
         self._preset: str = "all"
         self._active_note: Optional[str] = None
         self._config_path = CONFIG_PATH
         self._show_actions: bool = True
         self._theme: str = "dark"
+        self._applied_css: Optional[str] = None
+        # Widget handles, captured in compose.
+        self._hero: Static | None = None
+        self._hero_meta: Static | None = None
+        self._grid: Grid | None = None
+        self._legend: BucketLegend | None = None
+        self._sidebar: Vertical | None = None
+        self._actions: ActionsPanel | None = None
 
         self._last_actions_fetch_ts: Optional[float] = None
+        # Smoothed gap between live/bridge updates, for poll spacing.
+        self._live_gap_ewma: Optional[float] = None
+        # Monotonic time of each bucket's latest live/bridge update.
+        self._live_seen: OrderedDict[str, float] = OrderedDict()
+        self._last_live_arrival: Optional[float] = None
         self._ui_timer: Timer | None = None
         self._listener_added = False
         self._poll_worker: Worker[None] | None = None
-        self._poll_stop = False
+        self._poll_stop_event = asyncio.Event()
+        # Set when live data changes a bucket; wakes the render loop.
+        self._snapshot_event = asyncio.Event()
+        self._render_worker: Worker[None] | None = None
 
         self._fetch_lock = asyncio.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=REST_MAX_WORKERS, thread_name_prefix="gk-rest"
+        )
         self._load_config()
 
     def compose(self) -> ComposeResult:
+        # Keep handles to the widgets we update so refreshes never run selector queries.
+        self._hero = Static(self._hero_text(), id="hero-text")
+        self._hero_meta = Static(id="hero-meta")
+        self._legend = BucketLegend()
+        self._grid = Grid(id="bucket-grid")
+        self._actions = ActionsPanel()
         yield Header(show_clock=True)
         with Vertical(id="hero"):
             with Horizontal(id="hero-row"):
-                yield Static(self._hero_text(), id="hero-text")
-                yield Static(id="hero-meta")
-            yield BucketLegend()
+                yield self._hero
+                yield self._hero_meta
+            yield self._legend
         with Horizontal(id="layout"):
             with VerticalScroll(id="buckets"):
-                yield Grid(id="bucket-grid")
-            with Vertical(id="sidebar"):
-                yield ActionsPanel()
+                yield self._grid
+            with Vertical(id="sidebar") as sidebar:
+                self._sidebar = sidebar
+                yield self._actions
         yield Footer()
 
     async def on_mount(self) -> None:
+        # Listener callbacks arrive on request threads and hop onto this loop.
+        self._event_loop = asyncio.get_running_loop()
         self._apply_theme_css()
         # Live listener for real-time header updates when the client is used elsewhere.
         self._client.add_rate_limit_listener(self._snapshot_listener)
@@ -412,6 +565,12 @@ class RateLimitTextualApp(App):
             exclusive=True,
             description="rate-limit poller",
         )
+        self._render_worker = self.run_worker(
+            self._render_loop(),
+            group="render",
+            exclusive=True,
+            description="live update renderer",
+        )
         # Socket bridge for external updates.
         self._bridge_server = _RateLimitSocketServer(
             self._socket_path, self._handle_socket_update
@@ -421,32 +580,123 @@ class RateLimitTextualApp(App):
         await self._fetch_cycle(force=True)
 
     async def on_unmount(self) -> None:
-        self._poll_stop = True
+        self._poll_stop_event.set()
+        self._snapshot_event.set()
         if self._listener_added:
             self._client.remove_rate_limit_listener(self._snapshot_listener)
         if self._bridge_server:
             await self._bridge_server.stop()
+        # Stop the poller before the pool so no fetch submits work after shutdown.
+        if self._poll_worker is not None:
+            self._poll_worker.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
     async def _poll_loop(self) -> None:
-        while not self._poll_stop:
+        while not self._poll_stop_event.is_set():
             await self._fetch_cycle(force=True)
-            await asyncio.sleep(self._fetch_interval)
+            try:
+                # Wake immediately on unmount instead of sleeping out the interval.
+                await asyncio.wait_for(
+                    self._poll_stop_event.wait(),
+                    timeout=self._next_poll_delay(time.monotonic()),
+                )
+            except asyncio.TimeoutError:
+                continue
 
-    async def _fetch_cycle(self, force: bool = False) -> None:
-        async with self._fetch_lock:
-            await self._fetch_rate_limit(force=force)
-            await self._fetch_actions(force=force)
+    def _track_live_arrival(self, arrival: float) -> None:
+        last = self._last_live_arrival
+        self._last_live_arrival = arrival
+        if last is None:
+            return
+        gap = arrival - last
+        ewma = self._live_gap_ewma
+        self._live_gap_ewma = (
+            gap if ewma is None else ewma + LIVE_GAP_EWMA_ALPHA * (gap - ewma)
+        )
 
-    async def _fetch_rate_limit(self, *, force: bool = False) -> None:
-        now = time.time()
+    def _next_poll_delay(self, now: float) -> float:
+        """Seconds until the next poll, stretched while live updates cover every card."""
+        base = self._fetch_interval
+        ewma = self._live_gap_ewma
+        last = self._last_live_arrival
+        if ewma is None or last is None or now - last > 2 * ewma:
+            # No live feed, or it has gone quiet: poll on the normal cadence.
+            return base
+        if not self._live_covers_displayed(now):
+            # Some visible card only gets fresh numbers from the poll.
+            return base
         if (
-            not force
-            and self._meta.last_update_ts
-            and now - self._meta.last_update_ts < self._fetch_interval
+            self._actions_repos
+            or self._actions_billing_user
+            or self._actions_billing_org
         ):
+            # Actions data only arrives via polling.
+            return base
+        # The faster live updates arrive, the less a poll adds. Never poll more
+        # often than the fetch interval, nor less often than the user's refresh
+        # interval (u/d) allows.
+        stretched = base * base / max(ewma, 1e-3)
+        ceiling = min(base * POLL_MAX_BACKOFF, max(base, self._refresh_interval))
+        return min(max(base, stretched), ceiling)
+
+    def _live_covers_displayed(self, now: float) -> bool:
+        """True when every displayed bucket has had a recent live/bridge update."""
+        order = self._determine_bucket_order(self._resources)
+        if not order:
+            return False
+        displayed: Iterable[str] = order
+        if order == self._indexed_order:
+            displayed = [b for b, shown in zip(order, self._visible_mask) if shown]
+        cutoff = now - self._fetch_interval * LIVE_FRESHNESS_FRACTION
+        live_seen = self._live_seen
+        return all(live_seen.get(bucket, cutoff) > cutoff for bucket in displayed)
+
+    async def _render_loop(self) -> None:
+        """Redraw cards once per burst of live updates instead of once per update."""
+        event = self._snapshot_event
+        while not self._poll_stop_event.is_set():
+            await event.wait()
+            if self._poll_stop_event.is_set():
+                break  # woken by on_unmount; the widgets may already be gone
+            event.clear()
+            self._refresh_buckets()
+            self._refresh_meta()
+
+    async def _run_blocking(
+        self, fn: Callable[..., _T], *args: Any, **kwargs: Any
+    ) -> _T:
+        """Run blocking GitHub REST work on the dashboard's own thread pool."""
+        if self._poll_stop_event.is_set():
+            raise asyncio.CancelledError("dashboard is stopping")
+        loop = asyncio.get_running_loop()
+        try:
+            future = loop.run_in_executor(
+                self._executor, functools.partial(fn, *args, **kwargs)
+            )
+        except RuntimeError as exc:
+            # The pool was shut down on unmount; treat late fetches as stopping.
+            raise asyncio.CancelledError("dashboard is stopping") from exc
+        return await future
+
+    async def _fetch_cycle(self, force: bool = False, user: bool = False) -> None:
+        async with self._fetch_lock:
+            now = time.time()
+            await self._fetch_rate_limit(force=force, user=user, now=now)
+            await self._fetch_actions(force=force, now=now)
+
+    async def _fetch_rate_limit(
+        self, *, force: bool = False, user: bool = False, now: Optional[float] = None
+    ) -> None:
+        if now is None:
+            now = time.time()
+        last_ts = self._meta.last_update_ts
+        if not force and last_ts and now - last_ts < self._fetch_interval:
+            return
+        if not user and self._live_covers_displayed(time.monotonic()):
+            # Every visible card already has fresh live headers; a poll adds nothing.
             return
         try:
-            payload = await asyncio.to_thread(
+            payload = await self._run_blocking(
                 self._client.get_json,
                 "/rate_limit",
                 params=None,
@@ -466,37 +716,49 @@ class RateLimitTextualApp(App):
             self._meta.last_update_source = "error"
         self._refresh_meta()
 
-    async def _fetch_actions(self, *, force: bool = False) -> None:
+    async def _fetch_actions(
+        self, *, force: bool = False, now: Optional[float] = None
+    ) -> None:
         if (
             not self._actions_repos
             and not self._actions_billing_user
             and not self._actions_billing_org
         ):
             return
-        now = time.time()
+        if now is None:
+            now = time.time()
         if (
             not force
             and self._last_actions_fetch_ts
             and now - self._last_actions_fetch_ts < self._fetch_interval
         ):
             return
+        billing_scopes: list[tuple[str, Optional[str]]] = []
+        if self._actions_billing_user:
+            billing_scopes.append(("user", None))
+        if self._actions_billing_org:
+            billing_scopes.append(("org", self._actions_billing_org))
+        # Issue every REST call at once; each is an independent HTTP round trip.
+        repo_results, billing_results = await asyncio.gather(
+            asyncio.gather(
+                *(
+                    self._run_blocking(self._fetch_actions_repo, repo)
+                    for repo in self._actions_repos
+                )
+            ),
+            asyncio.gather(
+                *(
+                    self._run_blocking(self._fetch_actions_billing, scope)
+                    for scope in billing_scopes
+                )
+            ),
+        )
         statuses: MutableMapping[str, ActionsRepoStatus] = {}
-        for repo in self._actions_repos:
-            status = await asyncio.to_thread(self._fetch_actions_repo, repo)
+        for repo, status in zip(self._actions_repos, repo_results):
             if status:
                 statuses[repo] = status
         billing: MutableMapping[str, ActionsBillingStatus] = {}
-        if self._actions_billing_user:
-            billing_status = await asyncio.to_thread(
-                self._fetch_actions_billing, ("user", None)
-            )
-            if billing_status:
-                billing[billing_status.scope] = billing_status
-        if self._actions_billing_org:
-            billing_status = await asyncio.to_thread(
-                self._fetch_actions_billing,
-                ("org", self._actions_billing_org),
-            )
+        for billing_status in billing_results:
             if billing_status:
                 billing[billing_status.scope] = billing_status
         self._actions_status = statuses
@@ -511,29 +773,52 @@ class RateLimitTextualApp(App):
 
     def _snapshot_listener(self, bucket: str, state: BucketState) -> None:
         resource = _resource_from_snapshot(bucket, state)
-        self.call_from_thread(self._apply_snapshot, resource)
+        loop = self._event_loop
+        if loop is None:
+            return
+        with self._pending_lock:
+            schedule = not self._pending_snapshots
+            self._pending_snapshots[bucket] = resource
+        if not schedule:
+            # A drain is already queued; it will pick up this newer snapshot.
+            return
+        try:
+            loop.call_soon_threadsafe(self._drain_pending_snapshots)
+        except RuntimeError:
+            # Loop closed while the app was shutting down.
+            with self._pending_lock:
+                self._pending_snapshots.clear()
+
+    def _drain_pending_snapshots(self) -> None:
+        with self._pending_lock:
+            pending = self._pending_snapshots
+            self._pending_snapshots = {}
+        for resource in pending.values():
+            self._apply_snapshot(resource)
 
     def _apply_snapshot(self, resource: RateLimitResource) -> None:
-        self._resources[resource.bucket] = resource
-        self._meta.last_update_ts = time.time()
-        self._meta.last_update_source = "live"
-        self._record_activity(resource)
-        self._refresh_buckets()
-        self._refresh_meta()
+        self._apply_live_resource(resource, source="live")
 
     def _handle_socket_update(self, update: RateLimitUpdate) -> None:
-        resource = RateLimitResource(
-            bucket=update.bucket,
-            limit=update.limit,
-            remaining=update.remaining,
-            reset_ts=update.reset_ts,
+        resource = RateLimitResource.from_update(
+            update.bucket, update.limit, update.remaining, update.reset_ts
         )
-        self._resources[resource.bucket] = resource
+        self._apply_live_resource(resource, source="bridge")
+
+    def _apply_live_resource(self, resource: RateLimitResource, *, source: str) -> None:
+        arrival = time.monotonic()
+        self._track_live_arrival(arrival)
+        _lru_set(self._live_seen, resource.bucket, arrival)
         self._meta.last_update_ts = time.time()
-        self._meta.last_update_source = "bridge"
+        self._meta.last_update_source = source
+        if self._resources.get(resource.bucket) == resource:
+            # Unchanged bucket: only the "last update" line needs redrawing.
+            self._refresh_meta()
+            return
+        _lru_set(self._resources, resource.bucket, resource)
+        self._last_resources_sig = None
         self._record_activity(resource)
-        self._refresh_buckets()
-        self._refresh_meta()
+        self._snapshot_event.set()
 
     def _update_resources(
         self,
@@ -542,9 +827,19 @@ class RateLimitTextualApp(App):
         source: str,
         timestamp: float,
     ) -> None:
-        self._resources = dict(resources)
+        sig = tuple(
+            (bucket, r.limit, r.remaining, r.reset_ts)
+            for bucket, r in sorted(resources.items())
+        )
         self._meta.last_update_ts = timestamp
         self._meta.last_update_source = source
+        if sig == self._last_resources_sig:
+            # Same payload as the previous fetch: nothing to re-record or re-render.
+            return
+        self._last_resources_sig = sig
+        self._resources = OrderedDict(resources)
+        while len(self._resources) > MAX_TRACKED_BUCKETS:
+            self._resources.popitem(last=False)
         for resource in resources.values():
             self._record_activity(resource)
         self._refresh_buckets()
@@ -552,10 +847,12 @@ class RateLimitTextualApp(App):
     def _refresh_buckets(self) -> None:
         bucket_order = self._determine_bucket_order(self._resources)
         self._sync_manual_visibility(bucket_order)
-        visible_order = self._visible_bucket_order(bucket_order)
-        visible_set = set(visible_order)
-        grid = self.query_one("#bucket-grid", Grid)
-        grid.set_class(len(visible_order) <= 2, "single-col")
+        self._update_visible_mask(bucket_order)
+        visible_mask = self._visible_mask
+        grid = self._grid
+        if grid is None:
+            return
+        grid.set_class(visible_mask.count(True) <= 2, "single-col")
         # Create any missing cards.
         for bucket in bucket_order:
             if bucket not in self._bucket_cards:
@@ -563,15 +860,21 @@ class RateLimitTextualApp(App):
                 self._bucket_cards[bucket] = card
                 grid.mount(card)
         # Remove cards for buckets that disappeared.
+        bucket_index = self._bucket_index
         for bucket in list(self._bucket_cards.keys()):
-            if bucket not in bucket_order:
+            if bucket not in bucket_index:
                 self._bucket_cards[bucket].remove()
                 self._bucket_cards.pop(bucket, None)
-        for bucket in bucket_order:
+        resources = self._resources
+        for i, bucket in enumerate(bucket_order):
             card = self._bucket_cards[bucket]
-            card.display = bucket in visible_set
-            card.set_resource(self._resources.get(bucket))
-        self._update_legend(bucket_order, visible_set)
+            if card.display != visible_mask[i]:
+                card.display = visible_mask[i]
+            resource = resources.get(bucket)
+            # Live updates touch one bucket; leave the other cards alone.
+            if card.resource is not resource:
+                card.set_resource(resource)
+        self._update_legend(bucket_order, visible_mask)
 
     def _refresh_meta(self) -> None:
         dt_text = Text()
@@ -591,30 +894,65 @@ class RateLimitTextualApp(App):
         if meta.last_error:
             dt_text.append("\n")
             dt_text.append(f"Error: {meta.last_error}", style="bold red")
-        try:
-            hero_meta = self.query_one("#hero-meta", Static)
-            hero_meta.update(dt_text)
-        except Exception:
-            logger.debug("Unable to update hero meta panel", exc_info=True)
+        if self._hero_meta is not None:
+            self._hero_meta.update(dt_text)
 
     def _update_actions_panel(self) -> None:
-        panel = self.query_one(ActionsPanel)
+        panel = self._actions
+        sidebar = self._sidebar
+        if panel is None or sidebar is None:
+            return
         panel.update_data(statuses=self._actions_status, billing=self._actions_billing)
         panel.display = self._show_actions
-        try:
-            sidebar = self.query_one("#sidebar", Vertical)
-            sidebar.display = self._show_actions
-            sidebar.set_class(not self._show_actions, "compact")
-        except Exception:
-            pass
+        sidebar.display = self._show_actions
+        sidebar.set_class(not self._show_actions, "compact")
 
     def _record_activity(self, resource: RateLimitResource) -> None:
         remaining = resource.remaining
         bucket = resource.bucket
         prev = self._last_remaining.get(bucket)
         if remaining is not None and prev is not None and remaining != prev:
-            self._last_change_ts[bucket] = time.time()
-        self._last_remaining[bucket] = remaining
+            self._mark_recent(bucket)
+        _lru_set(self._last_remaining, bucket, remaining)
+
+    def _mark_recent(self, bucket: str) -> None:
+        """Flag a bucket as active until ACTIVITY_WINDOW_SECONDS pass without change."""
+        self._recent_buckets.add(bucket)
+        index = self._bucket_index.get(bucket)
+        if index is not None:
+            self._active_bits |= 1 << index
+        self._recent_seen[bucket] = time.monotonic()
+        if self._activity_timer is None:
+            # One shared timer aimed at the earliest expiry, instead of one per bucket.
+            # Later marks only push expiries back, so an early wake just reschedules.
+            self._activity_timer = self.set_timer(
+                ACTIVITY_WINDOW_SECONDS, self._expire_recent
+            )
+
+    def _expire_recent(self) -> None:
+        now = time.monotonic()
+        cutoff = now - ACTIVITY_WINDOW_SECONDS
+        expired = [b for b, seen in self._recent_seen.items() if seen <= cutoff]
+        for bucket in expired:
+            del self._recent_seen[bucket]
+            self._recent_buckets.discard(bucket)
+            index = self._bucket_index.get(bucket)
+            if index is not None:
+                self._active_bits &= ~(1 << index)
+        if self._activity_timer is not None:
+            self._activity_timer.stop()
+            self._activity_timer = None
+        if self._recent_seen:
+            next_expiry = min(self._recent_seen.values()) + ACTIVITY_WINDOW_SECONDS
+            self._activity_timer = self.set_timer(
+                max(next_expiry - now, 0.0), self._expire_recent
+            )
+        if not expired:
+            return
+        try:
+            self._refresh_buckets()
+        except Exception:
+            logger.debug("Unable to refresh after activity expiry", exc_info=True)
 
     def _pulse_ui(self) -> None:
         # Redraw countdowns and subtle timers.
@@ -638,10 +976,13 @@ class RateLimitTextualApp(App):
         if self._buckets:
             return self._buckets
         if resources:
-            filtered = tuple(
-                bucket for bucket in resources.keys() if bucket not in IGNORED_BUCKETS
-            )
-            return tuple(sorted(filtered))
+            key = frozenset(resources.keys())
+            cached = self._bucket_order_cache
+            if cached is not None and cached[0] == key:
+                return cached[1]
+            order = tuple(sorted(key - IGNORED_BUCKETS))
+            self._bucket_order_cache = (key, order)
+            return order
         return tuple()
 
     def _sync_manual_visibility(self, bucket_order: tuple[str, ...]) -> None:
@@ -649,26 +990,32 @@ class RateLimitTextualApp(App):
             if bucket not in self._manual_visibility:
                 self._manual_visibility[bucket] = True
 
-    def _visible_bucket_order(self, bucket_order: tuple[str, ...]) -> tuple[str, ...]:
+    def _update_visible_mask(self, bucket_order: tuple[str, ...]) -> None:
+        """Rebuild ``_visible_mask`` so entry ``i`` is the visibility of bucket ``i``."""
+        if bucket_order != self._indexed_order:
+            self._indexed_order = bucket_order
+            self._bucket_index = {bucket: i for i, bucket in enumerate(bucket_order)}
+            bits = 0
+            for bucket in self._recent_buckets:
+                index = self._bucket_index.get(bucket)
+                if index is not None:
+                    bits |= 1 << index
+            self._active_bits = bits
         self._active_note = None
         if self._preset == "manual":
-            return tuple(
-                bucket
-                for bucket in bucket_order
-                if self._manual_visibility.get(bucket, True)
-            )
+            manual = self._manual_visibility
+            self._visible_mask = [manual.get(bucket, True) for bucket in bucket_order]
+            return
         if self._preset == "active":
-            now = time.time()
-            active = tuple(
-                bucket
-                for bucket in bucket_order
-                if now - self._last_change_ts.get(bucket, 0) <= ACTIVITY_WINDOW_SECONDS
-            )
-            if active:
-                return active
+            bits = self._active_bits
+            if bits:
+                mask = [False] * len(bucket_order)
+                for index in _iter_set_bits(bits):
+                    mask[index] = True
+                self._visible_mask = mask
+                return
             self._active_note = "Active-only empty; showing all"
-            return bucket_order
-        return bucket_order
+        self._visible_mask = [True] * len(bucket_order)
 
     def _toggle_bucket_by_index(self, index: int) -> bool:
         bucket_order = self._determine_bucket_order(self._resources)
@@ -682,23 +1029,22 @@ class RateLimitTextualApp(App):
         self._refresh_buckets()
         return True
 
-    def _update_legend(self, bucket_order: tuple[str, ...], visible: set[str]) -> None:
-        try:
-            legend = self.query_one(BucketLegend)
-        except Exception:
+    def _update_legend(
+        self, bucket_order: tuple[str, ...], visible_mask: list[bool]
+    ) -> None:
+        legend = self._legend
+        if legend is None:
             return
         tones: MutableMapping[str, str] = {}
         recent: MutableMapping[str, bool] = {}
-        now = time.time()
+        recent_buckets = self._recent_buckets
         for bucket in bucket_order:
             resource = self._resources.get(bucket)
             tones[bucket] = _bucket_tone(resource)
-            recent[bucket] = (
-                now - self._last_change_ts.get(bucket, 0) <= ACTIVITY_WINDOW_SECONDS
-            )
+            recent[bucket] = bucket in recent_buckets
         legend.update_state(
             bucket_order,
-            visible={bucket: bucket in visible for bucket in bucket_order},
+            visible=dict(zip(bucket_order, visible_mask)),
             tones=tones,
             recent=recent,
             preset=self._preset,
@@ -706,7 +1052,7 @@ class RateLimitTextualApp(App):
         )
 
     async def action_refresh_now(self) -> None:
-        await self._fetch_cycle(force=True)
+        await self._fetch_cycle(force=True, user=True)
 
     async def action_faster(self) -> None:
         self._refresh_interval = max(
@@ -807,12 +1153,14 @@ class RateLimitTextualApp(App):
             logger.debug("Failed to persist UI config", exc_info=True)
 
     def _apply_theme_css(self) -> None:
-        palette = THEMES.get(self._theme, THEMES["dark"])
-        css = _build_css(palette)
+        css = _PRECOMPUTED_CSS.get(self._theme, _PRECOMPUTED_CSS["dark"])
+        if css == self._applied_css:
+            return
         try:
             self.stylesheet.read(css)
             self.refresh_css(reload=True)
             self.refresh()
+            self._applied_css = css
         except Exception:
             logger.debug("Failed to apply theme %s", self._theme, exc_info=True)
 
@@ -824,37 +1172,26 @@ class RateLimitTextualApp(App):
         try:
             payload = self._client.get_json(
                 path,
-                params={"per_page": "20"},
+                # Drop the embedded pull_requests arrays; only run status is read.
+                params={"per_page": "20", "exclude_pull_requests": "true"},
                 raise_for_status=False,
+                conditional=True,
             )
         except Exception:
             return None
         runs = payload.get("workflow_runs") if isinstance(payload, Mapping) else None
         if not isinstance(runs, list):
             return None
-        in_progress = 0
-        queued = 0
-        latest_status: Optional[str] = None
-        latest_conclusion: Optional[str] = None
-        latest_updated: Optional[str] = None
-        for run in runs:
-            status = run.get("status")
-            conclusion = run.get("conclusion")
-            if status == "in_progress":
-                in_progress += 1
-            elif status == "queued":
-                queued += 1
-            if latest_status is None:
-                latest_status = status
-                latest_conclusion = conclusion
-                latest_updated = run.get("updated_at")
+        counts = Counter(run.get("status") for run in runs)
+        # GitHub returns runs newest-first.
+        latest = runs[0] if runs else {}
         return ActionsRepoStatus(
             repo=repo,
-            in_progress=in_progress,
-            queued=queued,
-            latest_status=latest_status,
-            latest_conclusion=latest_conclusion,
-            latest_updated=latest_updated,
+            in_progress=counts["in_progress"],
+            queued=counts["queued"],
+            latest_status=latest.get("status"),
+            latest_conclusion=latest.get("conclusion"),
+            latest_updated=latest.get("updated_at"),
         )
 
     def _fetch_actions_billing(
@@ -870,7 +1207,9 @@ class RateLimitTextualApp(App):
         else:
             return None
         try:
-            payload = self._client.get_json(path, raise_for_status=False)
+            payload = self._client.get_json(
+                path, raise_for_status=False, conditional=True
+            )
         except Exception:
             return None
         if not isinstance(payload, Mapping):
@@ -883,44 +1222,88 @@ class RateLimitTextualApp(App):
         )
 
 
+_NOW_CACHE: Optional[tuple[float, datetime]] = None
+
+
+def _shared_now_utc() -> datetime:
+    """Return a UTC "now" shared by every render within NOW_CACHE_TTL_SECONDS."""
+    global _NOW_CACHE
+    ts = time.time()
+    cached = _NOW_CACHE
+    if cached is not None and 0 <= ts - cached[0] < NOW_CACHE_TTL_SECONDS:
+        return cached[1]
+    now = datetime.fromtimestamp(ts, timezone.utc)
+    _NOW_CACHE = (ts, now)
+    return now
+
+
+def _lru_set(mapping: OrderedDict, key: str, value: object) -> None:
+    """Insert into a bounded OrderedDict, evicting the least recently set keys."""
+    mapping[key] = value
+    mapping.move_to_end(key)
+    while len(mapping) > MAX_TRACKED_BUCKETS:
+        mapping.popitem(last=False)
+
+
+def _iter_set_bits(bits: int) -> Iterator[int]:
+    """Yield the indices of the set bits in ``bits``, lowest first."""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+_BAR_WIDTH = 20
+_BAR_FILL = tuple("█" * i for i in range(_BAR_WIDTH + 1))
+_BAR_EMPTY = tuple("·" * i for i in range(_BAR_WIDTH + 1))
+
+
 def _usage_bar(pct: float, color: str) -> str:
-    pct = max(min(pct, 100.0), 0.0)
-    width = 20
-    filled = int(width * (pct / 100))
-    empty = width - filled
-    return f"[{color}]{'█' * filled}[/][#22303f]{'·' * empty}[/] {pct:.1f}%"
+    pct = 0.0 if pct < 0.0 else 100.0 if pct > 100.0 else pct
+    filled = int(_BAR_WIDTH * (pct / 100))
+    return (
+        f"[{color}]{_BAR_FILL[filled]}[/]"
+        f"[#22303f]{_BAR_EMPTY[_BAR_WIDTH - filled]}[/] {pct:.1f}%"
+    )
+
 
+_FROMTS = datetime.fromtimestamp
+_UTC = timezone.utc
 
+
+@functools.lru_cache(maxsize=256)
 def _fmt_reset_time(reset_ts: Optional[int]) -> str:
+    # Reset timestamps repeat across many renders, so the formatted text is cached.
     if reset_ts is None:
         return "Reset: —"
-    dt = datetime.fromtimestamp(reset_ts, timezone.utc)
-    return f"Reset @ {dt.strftime('%H:%M:%S')} UTC"
+    return f"Reset @ {_FROMTS(reset_ts, _UTC).strftime('%H:%M:%S')} UTC"
+
+
+_TONE_THRESHOLDS = (60.0, 80.0)
+_TONES = ("turquoise2", "yellow3", "red3")
 
 
 def _bucket_tone(resource: Optional[RateLimitResource]) -> str:
     if not resource:
         return "cyan"
-    pct = resource.usage_percent or 0.0
-    tone = "turquoise2"
-    if pct >= 80:
-        tone = "red3"
-    elif pct >= 60:
-        tone = "yellow3"
-    return tone
+    return _TONES[bisect_right(_TONE_THRESHOLDS, resource.usage_percent or 0.0)]
+
+
+_ABBREV_KNOWN = {
+    "dependency_snapshots": "dep snaps",
+    "dependency_sbom": "dep sbom",
+    "integration_manifest": "integ manifest",
+    "code_scanning_upload": "code scan up",
+    "actions_runner_registration": "runner reg",
+    "source_import": "source import",
+}
 
 
+@functools.lru_cache(maxsize=64)
 def _abbrev_bucket(bucket: str) -> str:
-    known = {
-        "dependency_snapshots": "dep snaps",
-        "dependency_sbom": "dep sbom",
-        "integration_manifest": "integ manifest",
-        "code_scanning_upload": "code scan up",
-        "actions_runner_registration": "runner reg",
-        "source_import": "source import",
-    }
-    if bucket in known:
-        return known[bucket]
+    known = _ABBREV_KNOWN.get(bucket)
+    if known is not None:
+        return known
     if len(bucket) <= 16:
         return bucket
     parts = bucket.split("_")
@@ -931,72 +1314,91 @@ def _abbrev_bucket(bucket: str) -> str:
     return bucket[:16]
 
 
-def _build_css(palette: Mapping[str, str]) -> str:
-    bg = palette.get("bg", "#0c1118")
-    fg = palette.get("fg", "#e6edf3")
-    panel_bg = palette.get("panel_bg", "#0f1622")
-    hero_bg = palette.get("hero_bg", "#101826")
-    border = palette.get("border", "#7bdff2")
-    return f"""
-    Screen {{
-        background: {bg};
-        color: {fg};
-    }}
-    #hero {{
-        background: {hero_bg};
+_CSS_TEMPLATE = string.Template(
+    """
+    Screen {
+        background: $bg;
+        color: $fg;
+    }
+    #hero {
+        background: $hero_bg;
         padding: 1 2;
-        border: round {border};
+        border: round $border;
         margin: 1 1 0 1;
-    }}
-    #hero-text {{
+    }
+    #hero-text {
         margin-bottom: 0;
-    }}
-    #hero-row {{
+    }
+    #hero-row {
         height: auto;
         width: 1fr;
         padding-bottom: 1;
-    }}
-    #layout {{
+    }
+    #layout {
         margin: 1;
         height: 1fr;
-    }}
-    #buckets {{
-        background: {panel_bg};
-        border: round {border};
+    }
+    #buckets {
+        background: $panel_bg;
+        border: round $border;
         padding: 1;
         height: 1fr;
-    }}
-    #bucket-legend {{
+    }
+    #bucket-legend {
         margin: 0 0 1 0;
-    }}
-    #bucket-grid {{
+    }
+    #bucket-grid {
         grid-size: 2;
         grid-gutter: 1 1;
-    }}
-    .single-col {{
+    }
+    .single-col {
         grid-size: 1;
-    }}
-    #sidebar {{
+    }
+    #sidebar {
         width: 36;
         min-width: 28;
-        background: {panel_bg};
-        border: round {border};
+        background: $panel_bg;
+        border: round $border;
         padding: 1;
         height: 1fr;
-    }}
-    #sidebar.compact {{
+    }
+    #sidebar.compact {
         width: 28;
         min-width: 24;
-    }}
-    Footer, Header {{
-        background: {hero_bg};
-    }}
+    }
+    Footer, Header {
+        background: $hero_bg;
+    }
     """
+)
+
+
+def _build_css(palette: Mapping[str, str]) -> str:
+    return _render_css(
+        palette.get("bg", "#0c1118"),
+        palette.get("fg", "#e6edf3"),
+        palette.get("panel_bg", "#0f1622"),
+        palette.get("hero_bg", "#101826"),
+        palette.get("border", "#7bdff2"),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _render_css(bg: str, fg: str, panel_bg: str, hero_bg: str, border: str) -> str:
+    return _CSS_TEMPLATE.substitute(
+        bg=bg, fg=fg, panel_bg=panel_bg, hero_bg=hero_bg, border=border
+    )
+
+
+_PRECOMPUTED_CSS = {name: _build_css(palette) for name, palette in THEMES.items()}
 
 
 def _coerce_int(value: object) -> Optional[int]:
     if value is None:
         return None
+    if type(value) is int:
+        # Common case: already a plain int, skip the tuple isinstance and int().
+        return value
     if isinstance(value, (int, float)):
         return int(value)
     if isinstance(value, str):
@@ -0,0 +1,81 @@
+"""Test doubles shared across the test modules."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Callable, Optional
+
+import requests
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from gratekeeper.bridge import _dumps  # type: ignore[import-not-found]
+from gratekeeper.ratekeeper import BucketState  # type: ignore[import-not-found]
+
+_EMPTY_OK = _dumps({"ok": True})
+
+
+class StubSession(requests.Session):
+    def __init__(self, responses: list[Response]) -> None:
+        super().__init__()
+        self._responses = deque(responses)
+        self.calls: list[dict] = []
+
+    def request(self, method, url, **kwargs):  # type: ignore[override]
+        self.calls.append({"method": method.upper(), "url": url, **kwargs})
+        if not self._responses:
+            raise AssertionError("No more stub responses available")
+        response = self._responses.popleft()
+        response.url = url
+        return response
+
+
+def make_response(
+    status: int = 200, headers: dict | None = None, payload: dict | None = None
+) -> Response:
+    response = Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers or {})
+    response._content = _dumps(payload) if payload else _EMPTY_OK
+    response.encoding = "utf-8"
+    return response
+
+
+class StubClient:
+    """Minimal stand-in for RateLimitedGitHubClient used by the dashboards."""
+
+    def __init__(self, routes: Optional[dict[str, object]] = None) -> None:
+        self.listener: Optional[Callable[[str, BucketState], None]] = None
+        self.fetches = 0
+        self.routes = routes or {}
+
+    def add_rate_limit_listener(
+        self, listener: Callable[[str, BucketState], None]
+    ) -> None:
+        self.listener = listener
+
+    def remove_rate_limit_listener(
+        self, listener: Callable[[str, BucketState], None]
+    ) -> None:
+        if self.listener is listener:
+            self.listener = None
+
+    def emit(self, bucket: str, state: BucketState) -> None:
+        if self.listener:
+            self.listener(bucket, state)
+
+    def get_json(self, path, **kwargs):
+        self.fetches += 1
+        payload = self.routes.get(path)
+        if callable(payload):
+            return payload(path, **kwargs)  # type: ignore[misc]
+        if payload is not None:
+            return payload
+        return {
+            "resources": {
+                "core": {"limit": 60, "remaining": 55, "reset": 999},
+            }
+        }
+
+    def close(self) -> None:  # pragma: no cover
+        return
@@ -5,8 +5,11 @@ import socket
 import tempfile
 import threading
 
+from gratekeeper import bridge
 from gratekeeper.bridge import (
+    BatchingEmitter,
     RateLimitUpdate,
+    close_connections,
     emit_update,
     update_from_headers,
 )
@@ -66,6 +69,89 @@ def test_emit_update_sends_payload_over_socket() -> None:
         assert parsed["remaining"] == 9
         assert parsed["reset_ts"] == 123
     finally:
+        close_connections()
+        try:
+            os.remove(socket_path)
+        except OSError:
+            pass
+
+
+def test_dumps_falls_back_to_stdlib_json(monkeypatch) -> None:
+    monkeypatch.setattr(bridge, "orjson", None)
+    payload = bridge._dumps({"bucket": "core", "limit": 1})
+    assert isinstance(payload, bytes)
+    assert bridge._loads(payload) == {"bucket": "core", "limit": 1}
+
+
+def test_emit_update_reuses_connection() -> None:
+    tmpdir = tempfile.mkdtemp(prefix="gratekeeper-")
+    socket_path = os.path.join(tmpdir, "bridge.sock")
+    accepted = queue.Queue()
+    lines = queue.Queue()
+    ready = threading.Event()
+
+    def server() -> None:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as srv:
+            srv.bind(socket_path)
+            srv.listen(2)
+            ready.set()
+            conn, _ = srv.accept()
+            accepted.put(conn)
+            with conn, conn.makefile("rb") as reader:
+                for _ in range(2):
+                    lines.put(json.loads(reader.readline()))
+
+    thread = threading.Thread(target=server, daemon=True)
+    thread.start()
+
+    try:
+        ready.wait(timeout=1.0)
+        for remaining in (9, 8):
+            update = RateLimitUpdate(
+                bucket="core", limit=10, remaining=remaining, reset_ts=1
+            )
+            assert emit_update(update, socket_path=socket_path) is True
+        assert lines.get(timeout=1.0)["remaining"] == 9
+        assert lines.get(timeout=1.0)["remaining"] == 8
+        assert accepted.qsize() == 1
+    finally:
+        close_connections()
+        try:
+            os.remove(socket_path)
+        except OSError:
+            pass
+
+
+def test_batching_emitter_sends_array_frame() -> None:
+    tmpdir = tempfile.mkdtemp(prefix="gratekeeper-")
+    socket_path = os.path.join(tmpdir, "bridge.sock")
+    lines = queue.Queue()
+    ready = threading.Event()
+
+    def server() -> None:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as srv:
+            srv.bind(socket_path)
+            srv.listen(1)
+            ready.set()
+            conn, _ = srv.accept()
+            with conn, conn.makefile("rb") as reader:
+                lines.put(json.loads(reader.readline()))
+
+    thread = threading.Thread(target=server, daemon=True)
+    thread.start()
+
+    emitter = BatchingEmitter(socket_path=socket_path, interval=10.0, max_batch=10)
+    try:
+        ready.wait(timeout=1.0)
+        for bucket in ("core", "search", "graphql"):
+            emitter.submit(
+                RateLimitUpdate(bucket=bucket, limit=10, remaining=5, reset_ts=1)
+            )
+        emitter.close()
+        frame = lines.get(timeout=1.0)
+        assert [item["bucket"] for item in frame] == ["core", "search", "graphql"]
+    finally:
+        close_connections()
         try:
             os.remove(socket_path)
         except OSError:
@@ -1,43 +1,15 @@
 from __future__ import annotations
 
-import json
 import time
 import unittest
 from unittest.mock import patch
 
 import requests
-from requests import Response
-from requests.structures import CaseInsensitiveDict
 
 from gratekeeper.client import RateLimitedGitHubClient  # type: ignore[import-not-found]
 from gratekeeper.ratekeeper import BucketState, LocalGratekeeper  # type: ignore[import-not-found]
 
-
-class StubSession(requests.Session):
-    def __init__(self, responses: list[Response]) -> None:
-        super().__init__()
-        self._responses = responses
-        self.calls: list[dict] = []
-
-    def request(self, method, url, **kwargs):  # type: ignore[override]
-        self.calls.append({"method": method.upper(), "url": url, **kwargs})
-        if not self._responses:
-            raise AssertionError("No more stub responses available")
-        response = self._responses.pop(0)
-        response.url = url
-        return response
-
-
-def make_response(
-    status: int = 200, headers: dict | None = None, payload: dict | None = None
-) -> Response:
-    response = Response()
-    response.status_code = status
-    response.headers = CaseInsensitiveDict(headers or {})
-    body = json.dumps(payload or {"ok": True}).encode("utf-8")
-    response._content = body
-    response.encoding = "utf-8"
-    return response
+from tests._stubs import StubSession, make_response
 
 
 class RateLimitedGitHubClientTests(unittest.TestCase):
@@ -58,6 +30,8 @@ class RateLimitedGitHubClientTests(unittest.TestCase):
         self.assertEqual(session.calls[0]["method"], "GET")
         self.assertEqual(sent_headers["Authorization"], "Bearer abc123")
         self.assertEqual(sent_headers["Accept"], "application/vnd.github+json")
+        # Accept-Encoding is left to the session, which knows its decoders.
+        self.assertNotIn("Accept-Encoding", sent_headers)
 
     def test_get_updates_ratekeeper(self) -> None:
         resp_headers = {
@@ -105,6 +79,32 @@ class RateLimitedGitHubClientTests(unittest.TestCase):
         ]
         self.assertGreaterEqual(len(poll_calls), 1)
 
+    def test_adaptive_polling_interval_is_aimd(self) -> None:
+        keeper = LocalGratekeeper(now_fn=lambda: 0, sleep_fn=lambda _: None)
+        client = RateLimitedGitHubClient(session=StubSession([]), rate_keeper=keeper)
+        client._poll_interval = 8.0
+        client._poll_min_interval = 2.0
+        client._poll_max_interval = 32.0
+        keeper.after_response(
+            {
+                "X-RateLimit-Limit": "100",
+                "X-RateLimit-Remaining": "90",
+                "X-RateLimit-Reset": "10",
+            }
+        )
+
+        client._adapt_poll_interval(200)
+        self.assertEqual(client._poll_interval, 6.0)
+
+        client._adapt_poll_interval(429)
+        self.assertEqual(client._poll_interval, 12.0)
+
+        keeper.after_response({"X-RateLimit-Remaining": "10"})
+        client._adapt_poll_interval(200)
+        self.assertEqual(client._poll_interval, 24.0)
+        client._adapt_poll_interval(200)
+        self.assertEqual(client._poll_interval, 32.0)
+
     def test_rate_limit_listener_receives_updates(self) -> None:
         resp_headers = {
             "X-RateLimit-Limit": "60",
@@ -200,6 +200,41 @@ class RateLimitedGitHubClientTests(unittest.TestCase):
         self.assertEqual(snapshot.remaining, 4980)
         self.assertEqual(snapshot.reset_ts, 2345)
 
+    def test_conditional_get_json_reuses_payload_on_304(self) -> None:
+        first = make_response(headers={"ETag": '"abc"'}, payload={"runs": [1]})
+        not_modified = make_response(status=304)
+        session = StubSession([first, not_modified])
+        client = RateLimitedGitHubClient(session=session)
+
+        payload = client.get_json("/repos/o/r/actions/runs", conditional=True)
+        again = client.get_json("/repos/o/r/actions/runs", conditional=True)
+
+        self.assertEqual(payload, {"runs": [1]})
+        self.assertEqual(again, {"runs": [1]})
+        self.assertNotIn("If-None-Match", session.calls[0]["headers"])
+        self.assertEqual(session.calls[1]["headers"]["If-None-Match"], '"abc"')
+
+    def test_get_json_accepts_sequence_params(self) -> None:
+        first = make_response(headers={"ETag": '"abc"'}, payload={"runs": [1]})
+        not_modified = make_response(status=304)
+        plain = make_response(payload={"runs": [2]})
+        session = StubSession([first, not_modified, plain])
+        client = RateLimitedGitHubClient(session=session)
+        params = [("per_page", "20"), ("status", "queued")]
+
+        payload = client.get_json(
+            "/repos/o/r/actions/runs", params=params, conditional=True
+        )
+        again = client.get_json(
+            "/repos/o/r/actions/runs", params=list(reversed(params)), conditional=True
+        )
+        fresh = client.get_json("/repos/o/r/actions/runs", params=params)
+
+        self.assertEqual(payload, {"runs": [1]})
+        self.assertEqual(again, {"runs": [1]})
+        self.assertEqual(fresh, {"runs": [2]})
+        self.assertNotIn("If-None-Match", session.calls[2]["headers"])
+
     def test_killswitch_blocks_requests_until_expired(self) -> None:
         resp_headers = {
             "X-RateLimit-Limit": "60",
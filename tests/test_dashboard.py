@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import io
 from datetime import datetime, timezone
-from typing import Callable, Optional
 from unittest.mock import patch
 
 import os
+import select
+import sys
+
+import pytest
 
 from gratekeeper.dashboard import (
     RateLimitDashboard,
@@ -13,48 +16,16 @@ from gratekeeper.dashboard import (
     _coerce_resources,
     _fmt_delta,
     _launch_in_tmux,
+    _which_cached,
 )
 from gratekeeper.ratekeeper import BucketState
 
-
-class _StubClient:
-    def __init__(self, routes: Optional[dict[str, object]] = None) -> None:
-        self.listener: Optional[Callable[[str, BucketState], None]] = None
-        self.fetches = 0
-        self.routes = routes or {}
-
-    def add_rate_limit_listener(
-        self, listener: Callable[[str, BucketState], None]
-    ) -> None:
-        self.listener = listener
-
-    def remove_rate_limit_listener(
-        self, listener: Callable[[str, BucketState], None]
-    ) -> None:
-        if self.listener is listener:
-            self.listener = None
-
-    def emit(self, bucket: str, state: BucketState) -> None:
-        if self.listener:
-            self.listener(bucket, state)
-
-    def get_json(self, path, **kwargs):
-        self.fetches += 1
-        payload = self.routes.get(path)
-        if callable(payload):
-            return payload(path, **kwargs)  # type: ignore[misc]
-        if payload is not None:
-            return payload
-        return {
-            "resources": {
-                "core": {"limit": 60, "remaining": 55, "reset": 999},
-            }
-        }
+from tests._stubs import StubClient
 
 
 def test_dashboard_builds_table_with_known_resource() -> None:
     dash = RateLimitDashboard(
-        _StubClient(), buckets=("core",), auto_fetch=False, enable_keybindings=False
+        StubClient(), buckets=("core",), auto_fetch=False, enable_keybindings=False
     )
     future_reset = int(datetime.now(timezone.utc).timestamp()) + 60
     dash._resources["core"] = RateLimitResource(
@@ -89,8 +60,17 @@ def test_coerce_resources_casts_numeric_values() -> None:
     assert parsed["search"].limit is None
 
 
+def test_resource_from_update_reuses_unchanged_instance() -> None:
+    first = RateLimitResource.from_update("pool-test", 60, 45, 123)
+
+    assert RateLimitResource.from_update("pool-test", 60, 45, 123) is first
+    changed = RateLimitResource.from_update("pool-test", 60, 44, 123)
+    assert changed is not first
+    assert changed.remaining == 44
+
+
 def test_handle_snapshot_stores_latest_state() -> None:
-    client = _StubClient()
+    client = StubClient()
     dash = RateLimitDashboard(client, auto_fetch=False, enable_keybindings=False)
     state = BucketState(limit=100, remaining=80, reset_ts=500)
 
@@ -100,7 +80,7 @@ def test_handle_snapshot_stores_latest_state() -> None:
 
 
 def test_maybe_fetch_runs_when_idle() -> None:
-    client = _StubClient()
+    client = StubClient()
     dash = RateLimitDashboard(
         client, auto_fetch=True, fetch_interval=0.1, enable_keybindings=False
     )
@@ -112,7 +92,7 @@ def test_maybe_fetch_runs_when_idle() -> None:
 
 
 def test_maybe_fetch_skips_after_recent_update() -> None:
-    client = _StubClient()
+    client = StubClient()
     dash = RateLimitDashboard(
         client, auto_fetch=True, fetch_interval=60.0, enable_keybindings=False
     )
@@ -124,7 +104,7 @@ def test_maybe_fetch_skips_after_recent_update() -> None:
 
 
 def test_keypress_adjusts_refresh_speed_and_manual_fetch() -> None:
-    client = _StubClient()
+    client = StubClient()
     dash = RateLimitDashboard(
         client, auto_fetch=False, refresh_interval=8.0, enable_keybindings=False
     )
@@ -140,6 +120,28 @@ def test_keypress_adjusts_refresh_speed_and_manual_fetch() -> None:
     assert dash._manual_fetch_event.is_set()
 
 
+def test_stop_input_listener_wakes_thread_and_releases_pipe(monkeypatch) -> None:
+    dash = RateLimitDashboard(StubClient(), auto_fetch=False)
+    seen: list[int] = []
+
+    def _fake_read_keys(wake_fd: int) -> None:
+        seen.append(wake_fd)
+        select.select([wake_fd], [], [])
+
+    monkeypatch.setattr(dash, "_read_keys", _fake_read_keys)
+    monkeypatch.setattr(sys.stdin, "isatty", lambda: True)
+    dash._start_input_listener()
+    thread = dash._input_thread
+    assert thread is not None
+
+    dash._stop_input_listener()
+
+    assert not thread.is_alive()
+    assert dash._input_wake_fd is None
+    with pytest.raises(OSError):
+        os.fstat(seen[0])
+
+
 def test_actions_repo_status_fetch() -> None:
     routes = {
         "/repos/foo/bar/actions/runs": {
@@ -149,7 +151,7 @@ def test_actions_repo_status_fetch() -> None:
             ]
         }
     }
-    client = _StubClient(routes=routes)
+    client = StubClient(routes=routes)
     dash = RateLimitDashboard(
         client,
         auto_fetch=False,
@@ -171,7 +173,7 @@ def test_actions_billing_fetch_user() -> None:
             "total_paid_minutes_used": 0,
         }
     }
-    client = _StubClient(routes=routes)
+    client = StubClient(routes=routes)
     dash = RateLimitDashboard(
         client,
         auto_fetch=False,
@@ -193,7 +195,7 @@ def test_actions_data_clears_when_fetch_returns_nothing() -> None:
             ]
         }
     }
-    client = _StubClient(routes=routes)
+    client = StubClient(routes=routes)
     dash = RateLimitDashboard(
         client,
         auto_fetch=False,
@@ -219,7 +221,7 @@ def test_actions_billing_clears_when_unavailable() -> None:
             "total_paid_minutes_used": 0,
         }
     }
-    client = _StubClient(routes=routes)
+    client = StubClient(routes=routes)
     dash = RateLimitDashboard(
         client,
         auto_fetch=False,
@@ -237,11 +239,13 @@ def test_actions_billing_clears_when_unavailable() -> None:
 
 
 def test_launch_in_tmux_no_binary() -> None:
+    _which_cached.cache_clear()
     with patch("gratekeeper.dashboard.shutil.which", return_value=None):
         assert _launch_in_tmux(["--tmux-pane"]) is False
 
 
 def test_launch_in_tmux_invokes_tmux_command() -> None:
+    _which_cached.cache_clear()
     with patch("gratekeeper.dashboard.shutil.which", return_value="/usr/bin/tmux"):
         with patch.dict(os.environ, {"TMUX": "1"}, clear=True):
             captured: dict[str, list[str]] = {}
@@ -268,3 +272,51 @@ def test_main_tmux_flag_without_session_exits_with_message() -> None:
 
     assert code == 1
     assert "tmux" in stderr.getvalue().lower()
+
+
+def test_actions_fetch_covers_multiple_repos_and_billing() -> None:
+    routes = {
+        "/repos/foo/bar/actions/runs": {
+            "workflow_runs": [{"status": "in_progress", "conclusion": None}]
+        },
+        "/repos/foo/baz/actions/runs": {
+            "workflow_runs": [{"status": "queued", "conclusion": None}]
+        },
+        "/user/settings/billing/actions": {"total_minutes_used": 5},
+    }
+    client = StubClient(routes=routes)
+    dash = RateLimitDashboard(
+        client,
+        auto_fetch=False,
+        enable_keybindings=False,
+        actions_repos=("foo/bar", "foo/baz"),
+        actions_billing_user=True,
+    )
+
+    dash._maybe_fetch_actions(force=True)
+
+    assert dash._actions_status["foo/bar"].in_progress == 1
+    assert dash._actions_status["foo/baz"].queued == 1
+    assert dash._actions_billing["user"].total_minutes_used == 5
+
+
+def test_actions_pool_only_lives_for_run() -> None:
+    dash = RateLimitDashboard(
+        StubClient(),
+        auto_fetch=False,
+        enable_keybindings=False,
+        actions_repos=("foo/bar",),
+    )
+    assert dash._actions_pool is None
+
+    pools = []
+
+    def interrupt(_deadline: float) -> None:
+        pools.append(dash._actions_pool)
+        raise KeyboardInterrupt
+
+    with patch.object(dash, "_wait_for_next_iteration", side_effect=interrupt):
+        dash.run()
+
+    assert pools[0] is not None
+    assert dash._actions_pool is None
@@ -1,16 +1,41 @@
 from __future__ import annotations
 
+import json
 import os
 import sys
 
 import pytest
 
-from gratekeeper.demo_scenarios import run_scenarios
+from gratekeeper import demo_scenarios
+from gratekeeper.demo_scenarios import RunContext, run_scenarios, scenario_graphql
+from gratekeeper.ratekeeper import BucketState
 
 
-pytestmark = pytest.mark.demo
+class _FakeGraphQLClient:
+    def __init__(self, token: str) -> None:
+        self.token = token
 
+    def graphql_json(self, query: str, variables: dict) -> dict:
+        return {"data": {"user": {"login": variables["login"]}}}
 
+    def rate_limit_snapshot(self, bucket: str) -> BucketState:
+        return BucketState(limit=5000, remaining=4990, reset_ts=123)
+
+    def close(self) -> None:
+        pass
+
+
+def test_graphql_scenario_serialises_bucket_snapshot(monkeypatch) -> None:
+    monkeypatch.setattr(demo_scenarios, "RateLimitedGitHubClient", _FakeGraphQLClient)
+
+    result = scenario_graphql(RunContext(python=sys.executable, token="t"))
+
+    assert result.success, result.details
+    details = json.loads(result.details)
+    assert details["bucket"] == {"limit": 5000, "remaining": 4990, "reset_ts": 123}
+
+
+@pytest.mark.demo
 @pytest.mark.skipif(
     not os.getenv("GRATEKEEPER_RUN_DEMOS"),
     reason="Set GRATEKEEPER_RUN_DEMOS=1 to run live demo scenarios.",
@@ -1,76 +1,67 @@
 from __future__ import annotations
 
 import asyncio
-import types
+import os
+import tempfile
+import time
+from collections import OrderedDict
 
-from textual.widgets import Static
+import pytest
 
+from gratekeeper import bridge, textual_dashboard
+from gratekeeper.ratekeeper import BucketState
 from gratekeeper.textual_dashboard import (
+    BucketLegend,
     RateLimitResource,
     RateLimitTextualApp,
     _RateLimitSocketServer,
 )
 
+from tests._stubs import StubClient
 
-class _StubClient:
-    def __init__(self) -> None:
-        self.listener = None
 
-    def add_rate_limit_listener(self, listener) -> None:  # pragma: no cover - tiny stub
-        self.listener = listener
-
-    def remove_rate_limit_listener(self, listener) -> None:  # pragma: no cover
-        if self.listener is listener:
-            self.listener = None
-
-    def close(self) -> None:  # pragma: no cover
-        return
+class _TestApp(RateLimitTextualApp):
+    """Dashboard without background fetches/polling."""
 
+    async def _fetch_cycle(self, force: bool = False, user: bool = False) -> None:
+        return None
 
-async def _noop_cycle(self, force: bool = False) -> None:
-    return None
+    async def _poll_loop(self) -> None:
+        return None
 
 
-async def _noop_poll(self) -> None:
-    return None
+@pytest.fixture(scope="module")
+def module_loop():
+    # One loop for the module instead of a fresh asyncio.run() loop per test.
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
 
 
-def _make_app(monkeypatch) -> RateLimitTextualApp:
+@pytest.fixture(autouse=True, scope="module")
+def _ignore_user_config():
     # Ignore user config to keep tests deterministic.
-    monkeypatch.setattr(RateLimitTextualApp, "_load_config", lambda self: None)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(RateLimitTextualApp, "_load_config", lambda self: None)
+        yield
 
-    # Disable socket bridge to avoid permission issues in CI.
-    async def _noop_start(self):
-        return None
 
-    monkeypatch.setattr(_RateLimitSocketServer, "start", _noop_start)
-    client = _StubClient()
-    app = RateLimitTextualApp(client)
-    # Avoid background fetches/polling during tests.
-    monkeypatch.setattr(app, "_fetch_cycle", types.MethodType(_noop_cycle, app))
-    monkeypatch.setattr(app, "_poll_loop", types.MethodType(_noop_poll, app))
-    return app
+def _make_app() -> RateLimitTextualApp:
+    # No socket bridge, to avoid permission issues in CI.
+    return _TestApp(StubClient(), socket_path=None)
 
 
-def test_title_is_rendered(monkeypatch) -> None:
+def test_title_and_actions_toggle(module_loop) -> None:
+    # One pilot for the read-only title check and the sidebar toggle.
     async def _run():
-        app = _make_app(monkeypatch)
+        app = _make_app()
         async with app.run_test() as pilot:
             await pilot.pause()
-            hero = pilot.app.query_one("#hero-text", expect_type=Static)
-            rendered = hero.render()
+            rendered = app._hero.render()
             assert "GRatekeeper Dashboard" in str(rendered)
 
-    asyncio.run(_run())
-
-
-def test_actions_toggle_hides_sidebar(monkeypatch) -> None:
-    async def _run():
-        app = _make_app(monkeypatch)
-        async with app.run_test() as pilot:
-            await pilot.pause()
-            sidebar = pilot.app.query_one("#sidebar")
-            actions = pilot.app.query_one("ActionsPanel")
+            sidebar = app._sidebar
+            actions = app._actions
             assert sidebar.display is True
             assert actions.display is True
 
@@ -80,12 +71,12 @@ def test_actions_toggle_hides_sidebar(monkeypatch) -> None:
             assert sidebar.display is False
             assert actions.display is False
 
-    asyncio.run(_run())
+    module_loop.run_until_complete(_run())
 
 
-def test_active_only_filters_by_recent_activity(monkeypatch) -> None:
+def test_active_only_filters_by_recent_activity(module_loop) -> None:
     async def _run():
-        app = _make_app(monkeypatch)
+        app = _make_app()
         async with app.run_test() as pilot:
             await pilot.pause()
             # Establish baseline snapshots.
@@ -108,4 +99,319 @@ def test_active_only_filters_by_recent_activity(monkeypatch) -> None:
             assert core_card.display is True
             assert search_card.display is False
 
-    asyncio.run(_run())
+    module_loop.run_until_complete(_run())
+
+
+def test_recent_activity_expires_after_window(monkeypatch, module_loop) -> None:
+    async def _run():
+        app = _make_app()
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            app._mark_recent("core")
+            assert app._recent_buckets == {"core"}
+            assert app._activity_timer is not None
+
+            app._expire_recent()
+            assert app._recent_buckets == {"core"}
+
+            window = textual_dashboard.ACTIVITY_WINDOW_SECONDS
+            later = time.monotonic() + window / 2
+            with monkeypatch.context() as mp:
+                mp.setattr(textual_dashboard.time, "monotonic", lambda: later)
+                app._mark_recent("search")
+            later += window / 2 + 1
+            with monkeypatch.context() as mp:
+                mp.setattr(textual_dashboard.time, "monotonic", lambda: later)
+                app._expire_recent()
+            # "core" expires on time; the timer is re-aimed at "search".
+            assert app._recent_buckets == {"search"}
+            assert app._activity_timer is not None
+
+            later += window
+            with monkeypatch.context() as mp:
+                mp.setattr(textual_dashboard.time, "monotonic", lambda: later)
+                app._expire_recent()
+            assert app._recent_buckets == set()
+            assert app._activity_timer is None
+
+    module_loop.run_until_complete(_run())
+
+
+def test_live_update_only_rerenders_changed_card(monkeypatch, module_loop) -> None:
+    async def _run():
+        app = _make_app()
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            app._apply_snapshot(
+                RateLimitResource(bucket="core", limit=60, remaining=50, reset_ts=0)
+            )
+            app._apply_snapshot(
+                RateLimitResource(bucket="search", limit=10, remaining=8, reset_ts=0)
+            )
+            await pilot.pause()
+            updated: list[str] = []
+            for card in app._bucket_cards.values():
+
+                def _spy(resource, _card=card, _orig=card.set_resource):
+                    updated.append(_card.bucket)
+                    _orig(resource)
+
+                monkeypatch.setattr(card, "set_resource", _spy)
+
+            app._apply_snapshot(
+                RateLimitResource(bucket="core", limit=60, remaining=49, reset_ts=0)
+            )
+            await pilot.pause()
+            assert updated == ["core"]
+
+    module_loop.run_until_complete(_run())
+
+
+def test_snapshot_listener_coalesces_bursts(monkeypatch, module_loop) -> None:
+    async def _run():
+        app = _make_app()
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            applied: list[RateLimitResource] = []
+            monkeypatch.setattr(app, "_apply_snapshot", applied.append)
+
+            for remaining in (50, 49, 48):
+                app._snapshot_listener(
+                    "core", BucketState(limit=60, remaining=remaining, reset_ts=0)
+                )
+            app._snapshot_listener(
+                "search", BucketState(limit=10, remaining=8, reset_ts=0)
+            )
+            await pilot.pause()
+
+            assert [(r.bucket, r.remaining) for r in applied] == [
+                ("core", 48),
+                ("search", 8),
+            ]
+
+    module_loop.run_until_complete(_run())
+
+
+def test_bucket_legend_reuses_panel_when_state_unchanged() -> None:
+    legend = BucketLegend()
+    state = dict(
+        visible={"core": True},
+        tones={"core": "cyan"},
+        recent={"core": False},
+        preset="all",
+        note=None,
+    )
+    legend.update_state(("core",), **state)
+    panel = legend.render()
+
+    legend.update_state(("core",), **state)
+    assert legend.render() is panel
+
+    legend.update_state(("core",), **{**state, "preset": "active"})
+    assert legend.render() is not panel
+
+
+def test_lru_set_evicts_oldest_bucket(monkeypatch) -> None:
+    monkeypatch.setattr(textual_dashboard, "MAX_TRACKED_BUCKETS", 2)
+    tracked: OrderedDict[str, int] = OrderedDict()
+    textual_dashboard._lru_set(tracked, "core", 1)
+    textual_dashboard._lru_set(tracked, "search", 2)
+    textual_dashboard._lru_set(tracked, "core", 3)
+    textual_dashboard._lru_set(tracked, "graphql", 4)
+
+    assert list(tracked.items()) == [("core", 3), ("graphql", 4)]
+
+
+def test_iter_set_bits_yields_indices() -> None:
+    assert list(textual_dashboard._iter_set_bits(0)) == []
+    assert list(textual_dashboard._iter_set_bits(0b10110)) == [1, 2, 4]
+
+
+def test_poll_skips_rate_limit_fetch_when_live_data_is_fresh(module_loop) -> None:
+    client = StubClient()
+    calls: list[str] = []
+    client.get_json = lambda path, **kwargs: calls.append(path) or {}  # type: ignore[attr-defined]
+    app = RateLimitTextualApp(client, fetch_interval=60.0)
+    app._resources["core"] = RateLimitResource(
+        bucket="core", limit=60, remaining=50, reset_ts=0
+    )
+    app._live_seen["core"] = time.monotonic()
+
+    module_loop.run_until_complete(app._fetch_rate_limit(force=True))
+    assert calls == []
+
+    module_loop.run_until_complete(app._fetch_rate_limit(force=True, user=True))
+    assert calls == ["/rate_limit"]
+
+
+def test_poll_still_fetches_while_another_bucket_is_idle(module_loop) -> None:
+    client = StubClient()
+    calls: list[str] = []
+    client.get_json = lambda path, **kwargs: calls.append(path) or {}  # type: ignore[attr-defined]
+    app = RateLimitTextualApp(client, fetch_interval=60.0)
+    for bucket in ("core", "search"):
+        app._resources[bucket] = RateLimitResource(
+            bucket=bucket, limit=60, remaining=50, reset_ts=0
+        )
+    # A worker hammers "core"; nothing live ever reports "search".
+    app._live_seen["core"] = time.monotonic()
+    app._meta.last_update_ts = time.time()
+    app._meta.last_update_source = "live"
+
+    module_loop.run_until_complete(app._fetch_rate_limit(force=True))
+    assert calls == ["/rate_limit"]
+
+
+def test_poll_delay_stretches_while_live_updates_flow() -> None:
+    app = RateLimitTextualApp(StubClient(), fetch_interval=60.0, refresh_interval=300.0)
+    app._resources["core"] = RateLimitResource(
+        bucket="core", limit=60, remaining=50, reset_ts=0
+    )
+    assert app._next_poll_delay(0.0) == 60.0
+
+    for arrival in (0.0, 15.0, 30.0):
+        app._track_live_arrival(arrival)
+    app._live_seen["core"] = 30.0
+    assert app._live_gap_ewma == 15.0
+    assert app._next_poll_delay(31.0) == 240.0
+
+    # The stretch never outlasts the user's refresh interval.
+    app._refresh_interval = 120.0
+    assert app._next_poll_delay(31.0) == 120.0
+
+    # Feed has gone quiet: back to the normal cadence.
+    assert app._next_poll_delay(100.0) == 60.0
+
+
+def test_poll_delay_not_stretched_while_a_displayed_bucket_is_idle() -> None:
+    app = RateLimitTextualApp(StubClient(), fetch_interval=60.0, refresh_interval=300.0)
+    for bucket in ("core", "search"):
+        app._resources[bucket] = RateLimitResource(
+            bucket=bucket, limit=60, remaining=50, reset_ts=0
+        )
+    for arrival in (0.0, 15.0, 30.0):
+        app._track_live_arrival(arrival)
+    app._live_seen["core"] = 30.0
+
+    assert app._next_poll_delay(31.0) == 60.0
+
+
+def test_run_blocking_after_pool_shutdown_reports_stopping(module_loop) -> None:
+    app = RateLimitTextualApp(StubClient())
+    app._executor.shutdown()
+
+    with pytest.raises(asyncio.CancelledError):
+        module_loop.run_until_complete(app._run_blocking(lambda: None))
+
+
+def test_update_resources_skips_identical_payload(monkeypatch) -> None:
+    app = RateLimitTextualApp(StubClient())
+    refreshes: list[int] = []
+    monkeypatch.setattr(app, "_refresh_buckets", lambda: refreshes.append(1))
+    payload = {
+        "core": RateLimitResource(bucket="core", limit=60, remaining=50, reset_ts=0)
+    }
+
+    app._update_resources(payload, source="fetch", timestamp=1.0)
+    app._update_resources(dict(payload), source="fetch", timestamp=2.0)
+
+    assert len(refreshes) == 1
+    assert app._meta.last_update_ts == 2.0
+
+
+def test_apply_snapshot_skips_unchanged_bucket() -> None:
+    app = RateLimitTextualApp(StubClient())
+    resource = RateLimitResource(bucket="core", limit=60, remaining=50, reset_ts=0)
+
+    app._apply_snapshot(resource)
+    assert app._snapshot_event.is_set()
+
+    app._snapshot_event.clear()
+    app._apply_snapshot(
+        RateLimitResource(bucket="core", limit=60, remaining=50, reset_ts=0)
+    )
+    assert not app._snapshot_event.is_set()
+    assert app._meta.last_update_source == "live"
+
+
+def test_socket_server_accepts_batched_frames(module_loop) -> None:
+    received: list[tuple[str, int | None]] = []
+    # Short path: AF_UNIX socket paths are length limited.
+    socket_path = os.path.join(tempfile.mkdtemp(prefix="gratekeeper-"), "bridge.sock")
+
+    async def _run() -> None:
+        server = _RateLimitSocketServer(
+            socket_path,
+            lambda update: received.append((update.bucket, update.remaining)),
+        )
+        await server.start()
+        try:
+            _, writer = await asyncio.open_unix_connection(socket_path)
+            writer.write(
+                b'[{"bucket": "core", "remaining": 2}, {"bucket": "search"},'
+                b' {"bucket": "core", "remaining": 1}]\n'
+                b'{"bucket": "graphql"}\n'
+            )
+            await writer.drain()
+            writer.close()
+            for _ in range(50):
+                if len(received) == 3:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await server.stop()
+
+    module_loop.run_until_complete(_run())
+    # The stale "core" update in the batch is superseded by the newer one.
+    assert received == [("core", 1), ("search", None), ("graphql", None)]
+
+
+def test_socket_server_stops_with_open_emitter_connection(module_loop) -> None:
+    received: list[str] = []
+    socket_path = os.path.join(tempfile.mkdtemp(prefix="gratekeeper-"), "bridge.sock")
+
+    async def _run() -> None:
+        server = _RateLimitSocketServer(
+            socket_path, lambda update: received.append(update.bucket)
+        )
+        await server.start()
+        update = bridge.RateLimitUpdate("core", 60, 59, 0)
+        # emit_update blocks on the socket, so keep it off the server's loop.
+        sent = await asyncio.to_thread(
+            bridge.emit_update, update, socket_path=socket_path
+        )
+        assert sent
+        for _ in range(50):
+            if received:
+                break
+            await asyncio.sleep(0.01)
+        # The emitter's connection is still open; stop() must not wait on it.
+        await asyncio.wait_for(server.stop(), timeout=2.0)
+
+    try:
+        module_loop.run_until_complete(_run())
+        assert received == ["core"]
+        # The server closed its side, so the cached emitter socket sees EOF.
+        sock = bridge._connections[socket_path]
+        sock.settimeout(1.0)
+        assert sock.recv(1) == b""
+    finally:
+        bridge.close_connections()
+
+
+def test_render_loop_exits_without_refresh_when_stopping(
+    module_loop, monkeypatch
+) -> None:
+    app = _make_app()
+    refreshes: list[int] = []
+    monkeypatch.setattr(app, "_refresh_buckets", lambda: refreshes.append(1))
+
+    async def scenario() -> None:
+        task = asyncio.ensure_future(app._render_loop())
+        await asyncio.sleep(0)
+        app._poll_stop_event.set()
+        app._snapshot_event.set()
+        await asyncio.wait_for(task, timeout=1.0)
+
+    module_loop.run_until_complete(scenario())
+    assert refreshes == []